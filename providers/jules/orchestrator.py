@@ -19,35 +19,174 @@ This orchestrator sets up repositories and starts sessions that Jules executes a
 """
 
 import argparse
-import base64
+import atexit
+import csv
+import hashlib
 import json
+import math
 import os
+import queue
+import random
+import re
 import sys
+import threading
 import time
-import tempfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, Optional, Any, Tuple
 from dataclasses import dataclass
 import logging
+from logging.handlers import QueueHandler, QueueListener
 
-import pandas as pd
 import requests
-import yaml
+from requests.adapters import HTTPAdapter
 from slugify import slugify
+from urllib3.util.retry import Retry
 
-# Configure logging
+try:
+    import orjson  # Optional: faster JSON serialization
+except ImportError:
+    orjson = None
+
+if TYPE_CHECKING:
+    import pandas as pd  # Imported lazily at runtime; only needed for Excel idea files
+
+# Configure logging. Worker threads only enqueue records; a background listener does the
+# file and console I/O so concurrent ideas don't serialize on handler locks.
+_log_queue = queue.SimpleQueue()
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('jules_orchestrator.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
+    handlers=[QueueHandler(_log_queue)]
 )
+_log_listener = QueueListener(
+    _log_queue,
+    logging.FileHandler('jules_orchestrator.log'),
+    logging.StreamHandler(sys.stdout)
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
-
-@dataclass
+# GitHub rate-limit handling: waits double from RATE_LIMIT_BASE_DELAY, so 12 attempts
+# cover roughly one hour - the length of GitHub's primary rate-limit window.
+RATE_LIMIT_BASE_DELAY = 1.0
+RATE_LIMIT_MAX_ATTEMPTS = 12
+# GitHub asks clients to wait at least a minute after a secondary rate limit without Retry-After
+SECONDARY_RATE_LIMIT_WAIT = 60.0
+# Random extra wait so concurrent workers don't all retry at the same instant
+RATE_LIMIT_JITTER = 1.0
+# Below this many remaining requests, calls are spread evenly over the rest of the window
+RATE_LIMIT_LOW_WATERMARK = 50
+
+# Keep-alive connections per host; sized for many concurrent ideas talking to GitHub at once
+HTTP_POOL_MAXSIZE = 32
+
+# Cap on GitHub requests in flight across all threads, to stay under the secondary rate limits
+GITHUB_MAX_IN_FLIGHT = 10
+
+# Random gap between the first ideas of a batch, so the pool doesn't open with a burst of
+# repository creations that trips GitHub's secondary rate limit
+IDEA_START_SPACING = (0.2, 0.8)
+
+# Delays between checks for a new repository's initial branch
+BRANCH_POLL_DELAYS = (0.05, 0.1, 0.2, 0.4, 0.8, 1.6)
+
+# Jules session polling: the interval ceiling doubles from the minimum while the session is
+# unchanged and resets when it changes; each wait is drawn uniformly below it (full jitter)
+SESSION_POLL_MIN_INTERVAL = 2.0
+SESSION_POLL_MAX_INTERVAL = 60.0
+SESSION_POLL_MIN_SLEEP = 1.0
+# Per-state overrides of the ceiling: queued sessions change slowly, while a session that is
+# already working is checked more often so its pull request is picked up promptly
+SESSION_POLL_MAX_INTERVAL_BY_STATE = {
+    'QUEUED': 120.0,
+    'IN_PROGRESS': 30.0
+}
+
+# Checks for a seeded repository to appear in Jules sources: the delay ceiling doubles from
+# the base up to the maximum, and each wait is drawn from the upper half of it
+SOURCE_POLL_ATTEMPTS = 9
+SOURCE_POLL_BASE_DELAY = 1.5
+SOURCE_POLL_MAX_DELAY = 30.0
+# One list_sources() result answers every idea's check for this long
+SOURCES_CACHE_TTL = 5.0
+
+# Columns read from the ideas spreadsheet, in ExperimentIdea field order
+IDEA_COLUMNS = ['title', 'idea', 'has_experiments', 'experiments', 'data_url', 'requirements']
+
+# Cell strings pandas reads as missing by default (its na_values); the csv/openpyxl path matches them
+_MISSING_CELL_VALUES = frozenset((
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null'
+))
+
+# Spreadsheet strings treated as true in the has_experiments column
+_TRUE_VALUES = frozenset(('true', '1', 'yes', 'y', 't'))
+
+# Per-idea dataclasses use __slots__ where dataclasses support it (Python 3.10+)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Template placeholders, substituted in a single pass over each template
+_PLACEHOLDER_RE = re.compile(r'\{\{(REPO_NAME|IDEA_TITLE|IDEA_DESCRIPTION)\}\}')
+
+# Fast path for slugs: short titles made only of these characters slugify to the same result
+# as python-slugify with a couple of regex passes (digit-grouping commas are dropped, as it does)
+_SIMPLE_TITLE_RE = re.compile(r'[A-Za-z0-9 ,.:;!?()/_\-]{0,70}')
+_DIGIT_COMMA_RE = re.compile(r'(?<=\d),(?=\d)')
+_SLUG_SEPARATOR_RE = re.compile(r'[^a-z0-9]+')
+
+
+def _dumps_json(data: Any) -> str:
+    """Serialize data as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(data, indent=2)
+
+
+@lru_cache(maxsize=None)
+def _load_template(template_path: Path) -> Optional[str]:
+    """Read a template file once per run; returns None if it doesn't exist."""
+    if not template_path.exists():
+        return None
+    return template_path.read_text()
+
+
+def _iter_csv_rows(path: str) -> Iterator[Dict[str, Any]]:
+    """Yield the rows of a CSV file as dicts keyed by header."""
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        yield from csv.DictReader(f)
+
+
+def _iter_xlsx_rows(path: str) -> Iterator[Dict[str, Any]]:
+    """Stream the rows of a workbook's first sheet as dicts keyed by header (blank rows skipped)."""
+    import openpyxl
+
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        for values in rows:
+            if any(value is not None for value in values):
+                yield dict(zip(header, values))
+    finally:
+        workbook.close()
+
+
+def _parse_has_experiments(value: Any) -> bool:
+    """Parse the has_experiments column (handles various boolean representations)."""
+    if isinstance(value, str):
+        return value.strip().lower() in _TRUE_VALUES
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return False
+    return bool(value)
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ExperimentIdea:
     """Represents an experiment idea from the input CSV/Excel."""
     title: str
@@ -56,6 +195,16 @@ class ExperimentIdea:
     experiments: Optional[str] = None  # Pre-defined experiments YAML (if has_experiments is True)
     data_url: Optional[str] = None
     requirements: Optional[str] = None
+    slug: Optional[str] = None  # Repo-safe title, computed once when the idea is read
+
+
+def _slugify_title(title: str, index: int = 0) -> str:
+    """Build a repository-safe slug for an idea title, leaving room for the provider suffix."""
+    if _SIMPLE_TITLE_RE.fullmatch(title):
+        slug = _SLUG_SEPARATOR_RE.sub('-', _DIGIT_COMMA_RE.sub('', title.lower())).strip('-')
+    else:
+        slug = slugify(title, max_length=70, word_boundary=True)
+    return slug or f"experiment-{int(time.time())}-{index}"
 
 
 @dataclass
@@ -64,6 +213,73 @@ class RepoConfig:
     owner: str
     token: str
     max_concurrent: int = 3
+    state_file: Optional[str] = None  # JSON file recording per-idea progress for resuming runs
+
+
+class StateCache:
+    """
+    Persistent record of the phases each idea has completed, so an interrupted run can resume.
+
+    Entries are keyed by a hash of the idea's title and description and stored as JSON,
+    rewritten atomically after every update. A cache without a path only lives in memory.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = Path(path) if path else None
+        self._lock = threading.Lock()
+        self._state: Dict[str, Dict[str, Any]] = {}
+
+        if self.path and self.path.exists():
+            with open(self.path, 'r') as f:
+                self._state = json.load(f)
+            logger.info(f"Loaded state for {len(self._state)} ideas from {self.path}")
+
+    @staticmethod
+    def key_for(idea: ExperimentIdea) -> str:
+        """Stable key identifying an idea across runs."""
+        raw = f'{idea.title}\n{idea.idea}'.encode('utf-8')
+        return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Dict[str, Any]:
+        """Return a copy of the recorded state for an idea (empty if unseen)."""
+        with self._lock:
+            return dict(self._state.get(key, {}))
+
+    def update(self, key: str, **fields: Any):
+        """Record completed-phase fields for an idea and flush to disk."""
+        with self._lock:
+            self._state.setdefault(key, {}).update(fields)
+            if self.path:
+                tmp_path = self.path.with_name(self.path.name + '.tmp')
+                with open(tmp_path, 'w') as f:
+                    json.dump(self._state, f, indent=2)
+                os.replace(tmp_path, self.path)
+
+
+class SourcesCache:
+    """
+    Names of the repositories connected to Jules, shared by all ideas in a run.
+
+    A single list_sources() call can confirm many repositories, so the names are refetched
+    only when a lookup misses and the last fetch is older than SOURCES_CACHE_TTL. Names
+    accumulate across fetches: a repository confirmed once is never probed again.
+    """
+
+    def __init__(self, fetch: Callable[[], List[Dict[str, Any]]]):
+        self._fetch = fetch
+        self._lock = threading.Lock()
+        self._names: set = set()
+        self._fetched_at: Optional[float] = None
+
+    def contains(self, source_name: str) -> bool:
+        """Whether source_name is connected, refreshing the names if they may be stale."""
+        with self._lock:
+            if source_name in self._names:
+                return True
+            if self._fetched_at is None or time.monotonic() - self._fetched_at >= SOURCES_CACHE_TTL:
+                self._names.update(s.get('name', '') for s in self._fetch())
+                self._fetched_at = time.monotonic()
+            return source_name in self._names
 
 
 class GitHubClient:
@@ -78,8 +294,100 @@ class GitHubClient:
             'Accept': 'application/vnd.github+json',
             'X-GitHub-Api-Version': '2022-11-28'
         })
+        # Retry transient server/network errors with exponential backoff
+        retry = Retry(
+            total=8,
+            backoff_factor=2.8,
+            status_forcelist=[500, 502, 503, 504],
+            allowed_methods=frozenset(['GET', 'POST', 'PUT', 'PATCH']),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        self.session.mount('https://', HTTPAdapter(max_retries=retry, pool_maxsize=HTTP_POOL_MAXSIZE))
         self.api_base = 'https://api.github.com'
 
+        # The owner is fixed for a run, so its account type only needs looking up once
+        self._is_user_cache: Optional[bool] = None
+        # Repository metadata keyed by full name, filled from create/get responses
+        self._repo_meta_cache: Dict[str, Dict[str, Any]] = {}
+        # Shared by every thread using this client; not held while sleeping off a rate limit
+        self._in_flight = threading.BoundedSemaphore(GITHUB_MAX_IN_FLIGHT)
+        # Earliest time (time.monotonic) the next request may go out while the quota is low
+        self._pace_lock = threading.Lock()
+        self._next_request_at = 0.0
+
+    def close(self):
+        """Close the pooled HTTP connections held by this client."""
+        self.session.close()
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request, waiting out GitHub rate limits (403/429) before giving up."""
+        # Serialize JSON bodies once up front (with orjson when available) rather than per attempt
+        if 'json' in kwargs:
+            payload = kwargs.pop('json')
+            kwargs['data'] = orjson.dumps(payload) if orjson is not None else json.dumps(payload).encode('utf-8')
+            kwargs['headers'] = {**kwargs.get('headers', {}), 'Content-Type': 'application/json'}
+
+        delay = RATE_LIMIT_BASE_DELAY
+        for attempt in range(RATE_LIMIT_MAX_ATTEMPTS):
+            with self._in_flight:
+                response = self.session.request(method, url, **kwargs)
+            if response.status_code not in (403, 429):
+                self._throttle(response)
+                return response
+            if attempt == RATE_LIMIT_MAX_ATTEMPTS - 1:
+                return response
+
+            wait = self._rate_limit_wait(response)
+            if wait is None:
+                # A plain 403 (e.g. missing permissions) - retrying won't help
+                return response
+
+            wait = max(wait, delay) + random.uniform(0, RATE_LIMIT_JITTER)
+            logger.warning(f"GitHub rate limit hit ({response.status_code}), "
+                           f"retrying in {wait:.0f}s (attempt {attempt + 1}/{RATE_LIMIT_MAX_ATTEMPTS})")
+            time.sleep(wait)
+            delay *= 2
+
+        return response
+
+    def _throttle(self, response: requests.Response):
+        """Slow down before the quota runs out, pacing the remaining requests until the reset.
+
+        The pace is shared by every thread using this client: each caller reserves the next
+        free slot, so concurrent workers together spend the quota at the intended rate.
+        """
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        if remaining is None or int(remaining) >= RATE_LIMIT_LOW_WATERMARK:
+            return
+
+        reset_wait = int(response.headers.get('X-RateLimit-Reset', 0)) - time.time()
+        if reset_wait > 0:
+            interval = reset_wait / max(int(remaining), 1)
+            with self._pace_lock:
+                now = time.monotonic()
+                self._next_request_at = max(now, self._next_request_at) + interval
+                pause = self._next_request_at - now
+            logger.debug("GitHub rate limit low (%s left), pausing %.1fs", remaining, pause)
+            time.sleep(pause)
+
+    @staticmethod
+    def _rate_limit_wait(response: requests.Response) -> Optional[float]:
+        """Seconds to wait for a rate-limited response, or None if it isn't rate limiting."""
+        headers = response.headers
+        retry_after = headers.get('Retry-After')
+        if headers.get('X-RateLimit-Remaining') == '0':
+            # Primary limit: the quota is spent until the window resets
+            reset_wait = int(headers.get('X-RateLimit-Reset', 0)) - time.time()
+            return max(reset_wait, float(retry_after or 0), 1.0)
+
+        # Secondary limit: X-RateLimit-Reset is sent on every response, so it says nothing here
+        if retry_after is not None:
+            return max(float(retry_after), 1.0)
+        if response.status_code == 429 or 'secondary rate limit' in response.text.lower():
+            return SECONDARY_RATE_LIMIT_WAIT
+        return None
+
     def create_repo(self, name: str, description: str = "", private: bool = True) -> Dict[str, Any]:
         """Create a new GitHub repository and return repo data including default branch."""
         url = f'{self.api_base}/orgs/{self.owner}/repos'
@@ -93,7 +401,7 @@ class GitHubClient:
             'auto_init': True  # Jules requires an initial commit
         }
 
-        response = self.session.post(url, json=payload)
+        response = self._request('POST', url, json=payload)
         response.raise_for_status()
 
         repo_data = response.json()
@@ -103,59 +411,122 @@ class GitHubClient:
         logger.info(f"Created repository: {full_name}")
         logger.info(f"Default branch: {default_branch}")
         
-        return {
+        repo_info = {
             'full_name': full_name,
             'default_branch': default_branch,
             'repo_data': repo_data
         }
+        self._repo_meta_cache[full_name] = repo_info
+        return repo_info
 
     def _is_user_account(self) -> bool:
-        """Check if the owner is a user account vs organization."""
-        url = f'{self.api_base}/users/{self.owner}'
-        response = self.session.get(url)
-        response.raise_for_status()
-        return response.json()['type'] == 'User'
+        """Check if the owner is a user account vs organization (cached per client)."""
+        if self._is_user_cache is None:
+            url = f'{self.api_base}/users/{self.owner}'
+            response = self._request('GET', url)
+            response.raise_for_status()
+            self._is_user_cache = response.json()['type'] == 'User'
+        return self._is_user_cache
     
-    def get_repo(self, repo_full_name: str) -> Dict[str, Any]:
-        """Get repository information including default branch."""
+    def get_repo(self, repo_full_name: str, refresh: bool = False) -> Dict[str, Any]:
+        """Get repository information including default branch.
+
+        Results are cached per repository; pass refresh=True to force a new lookup.
+        """
+        if not refresh and repo_full_name in self._repo_meta_cache:
+            return self._repo_meta_cache[repo_full_name]
+
         url = f'{self.api_base}/repos/{repo_full_name}'
-        response = self.session.get(url)
+        response = self._request('GET', url)
         response.raise_for_status()
         
         repo_data = response.json()
-        return {
+        repo_info = {
             'full_name': repo_data['full_name'],
             'default_branch': repo_data.get('default_branch', 'main'),
             'repo_data': repo_data
         }
+        self._repo_meta_cache[repo_full_name] = repo_info
+        return repo_info
+
+    def get_branch(self, repo_full_name: str, branch: str) -> Dict[str, Any]:
+        """Get a branch, including its head commit and that commit's tree."""
+        response = self._request('GET', f'{self.api_base}/repos/{repo_full_name}/branches/{branch}')
+        response.raise_for_status()
+        return response.json()
 
-    def put_file(self, repo_full_name: str, path: str, content: str, message: str) -> Dict[str, Any]:
-        """Create or update a file in the repository."""
-        url = f'{self.api_base}/repos/{repo_full_name}/contents/{path}'
+    def commit_files(self, repo_full_name: str, branch: str, files: Dict[str, str], message: str) -> str:
+        """Commit several files to a branch as a single commit using the Git Data API.
 
-        # Encode content as base64
-        content_b64 = base64.b64encode(content.encode('utf-8')).decode('utf-8')
+        Instead of one Contents API round-trip (plus an existence check) per file, this
+        creates one tree with the file contents inline, one commit, and updates the ref.
+        Files whose git blob SHA already matches the branch tree are left out of the tree,
+        and no commit is created when nothing changed.
 
-        payload = {
-            'message': message,
-            'content': content_b64
+        Args:
+            repo_full_name: Full repository name (owner/repo)
+            branch: Branch to commit to (must already exist)
+            files: Mapping of repository path to file content
+            message: Commit message
+
+        Returns:
+            SHA of the new commit (or the current head if nothing changed)
+        """
+        repo_url = f'{self.api_base}/repos/{repo_full_name}'
+
+        # Resolve the current head of the branch and its tree in one call
+        head = self.get_branch(repo_full_name, branch)['commit']
+        parent_sha = head['sha']
+        base_tree_sha = head['commit']['tree']['sha']
+
+        response = self._request('GET', f'{repo_url}/git/trees/{base_tree_sha}', params={'recursive': '1'})
+        response.raise_for_status()
+        remote_shas = {
+            entry['path']: entry['sha']
+            for entry in response.json().get('tree', [])
+            if entry.get('type') == 'blob'
         }
 
-        # Check if file exists and get its SHA if it does
-        try:
-            existing = self.session.get(url)
-            if existing.status_code == 200:
-                sha = existing.json()['sha']
-                payload['sha'] = sha
-                logger.debug(f"File {path} exists, updating with SHA {sha[:7]}...")
-        except Exception:
-            # File doesn't exist, we'll create it
-            pass
-
-        response = self.session.put(url, json=payload)
+        # Only send files whose content differs from what is already on the branch
+        changed = {
+            path: content
+            for path, content in files.items()
+            if remote_shas.get(path) != self._git_blob_sha(content.encode('utf-8'))
+        }
+
+        if not changed:
+            logger.debug("No changes to commit to %s@%s", repo_full_name, branch)
+            return parent_sha
+
+        # Text content inline in the tree lets GitHub create the blobs, saving a POST per file
+        tree = [
+            {'path': path, 'mode': '100644', 'type': 'blob', 'content': content}
+            for path, content in changed.items()
+        ]
+        response = self._request('POST', f'{repo_url}/git/trees',
+                                 json={'base_tree': base_tree_sha, 'tree': tree})
         response.raise_for_status()
+        tree_sha = response.json()['sha']
 
-        return response.json()
+        response = self._request('POST', f'{repo_url}/git/commits', json={
+            'message': message,
+            'tree': tree_sha,
+            'parents': [parent_sha]
+        })
+        response.raise_for_status()
+        commit_sha = response.json()['sha']
+
+        response = self._request('PATCH', f'{repo_url}/git/refs/heads/{branch}', json={'sha': commit_sha})
+        response.raise_for_status()
+
+        logger.debug("Committed %d/%d files to %s@%s (%.7s)", len(changed), len(files), repo_full_name, branch, commit_sha)
+        return commit_sha
+
+    @staticmethod
+    def _git_blob_sha(data: bytes) -> str:
+        """Compute the SHA-1 git assigns to a blob with this content."""
+        header = f'blob {len(data)}\0'.encode('utf-8')
+        return hashlib.sha1(header + data).hexdigest()
 
     def create_issue(self, repo_full_name: str, title: str, body: str, labels: List[str] = None) -> str:
         """Create a GitHub issue."""
@@ -167,7 +538,7 @@ class GitHubClient:
             'labels': labels or []
         }
 
-        response = self.session.post(url, json=payload)
+        response = self._request('POST', url, json=payload)
         response.raise_for_status()
 
         return response.json()['html_url']
@@ -183,8 +554,40 @@ class JulesClient:
             'X-Goog-Api-Key': api_key,
             'Content-Type': 'application/json'
         })
+        # Retry throttling and transient server errors on reads only; a retried POST
+        # could create a duplicate session or send a message twice
+        retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset(['GET']),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        self.session.mount('https://', HTTPAdapter(max_retries=retry, pool_maxsize=HTTP_POOL_MAXSIZE))
         self.api_base = 'https://jules.googleapis.com/v1alpha'
 
+        # Last (ETag, parsed body) per polled URL, for conditional GETs
+        self._etag_cache: Dict[str, Tuple[Optional[str], Any]] = {}
+
+    def close(self):
+        """Close the pooled HTTP connections held by this client."""
+        self.session.close()
+
+    def _get_cached(self, url: str) -> Any:
+        """GET a JSON resource, sending If-None-Match so unchanged data comes back as a bodyless 304."""
+        etag, cached = self._etag_cache.get(url, (None, None))
+        headers = {'If-None-Match': etag} if etag else {}
+
+        response = self.session.get(url, headers=headers)
+        if response.status_code == 304 and cached is not None:
+            return cached
+
+        response.raise_for_status()
+        data = response.json()
+        self._etag_cache[url] = (response.headers.get('ETag'), data)
+        return data
+
     def list_sources(self) -> List[Dict[str, Any]]:
         """List all GitHub repositories connected to Jules."""
         response = self.session.get(f'{self.api_base}/sources')
@@ -263,9 +666,8 @@ class JulesClient:
         Returns:
             List of activity objects
         """
-        response = self.session.get(f'{self.api_base}/sessions/{session_id}/activities?pageSize=50')
-        response.raise_for_status()
-        return response.json().get('activities', [])
+        data = self._get_cached(f'{self.api_base}/sessions/{session_id}/activities?pageSize=50')
+        return data.get('activities', [])
 
     def approve_plan(self, session_id: str) -> bool:
         """
@@ -315,287 +717,24 @@ class JulesClient:
         Returns:
             Session data
         """
-        response = self.session.get(f'{self.api_base}/sessions/{session_id}')
-        response.raise_for_status()
-        return response.json()
-
-
-class JulesOrchestrator:
-    """Main orchestrator for creating and managing experiment repositories for Jules."""
-
-    def __init__(self, config: RepoConfig, jules_api_key: str):
-        self.config = config
-        self.github = GitHubClient(config.token, config.owner)
-        self.jules = JulesClient(jules_api_key)
-
-    def load_ideas(self, input_path: str) -> List[ExperimentIdea]:
-        """
-        Load experiment ideas from CSV or Excel file.
-        
-        Expected columns:
-        - title: Experiment title
-        - has_experiments: Boolean (True/1 if experiments provided, False/0 if AI should plan)
-        - idea: Description of the idea
-        - experiments: Pre-defined experiments YAML (optional, used when has_experiments is True)
-        """
-        if input_path.endswith(('.xlsx', '.xls')):
-            df = pd.read_excel(input_path)
-        else:
-            df = pd.read_csv(input_path)
-
-        ideas = []
-        for _, row in df.iterrows():
-            # Parse has_experiments column (handle various boolean representations)
-            has_experiments_raw = row.get('has_experiments', False)
-            if isinstance(has_experiments_raw, str):
-                has_experiments = has_experiments_raw.lower() in ('true', '1', 'yes', 'y')
-            else:
-                has_experiments = bool(has_experiments_raw)
-            
-            idea = ExperimentIdea(
-                title=str(row.get('title', f'Idea_{len(ideas)}')),
-                idea=str(row.get('idea', '')),
-                has_experiments=has_experiments,
-                experiments=row.get('experiments') if has_experiments else None,
-                data_url=row.get('data_url'),
-                requirements=row.get('requirements')
-            )
-            ideas.append(idea)
-
-        logger.info(f"Loaded {len(ideas)} experiment ideas")
-        logger.info(f"  - {sum(1 for i in ideas if i.has_experiments)} with pre-defined experiments")
-        logger.info(f"  - {sum(1 for i in ideas if not i.has_experiments)} requiring AI planning")
-        return ideas
-
-    def create_experiment_repo(self, idea: ExperimentIdea) -> Tuple[str, str, str]:
-        """Create a GitHub repository for an experiment idea.
-        
-        Returns:
-            Tuple of (full_name, repo_name, default_branch)
-        """
-        # Generate a clean repo name with provider suffix
-        repo_name = slugify(idea.title, max_length=70, word_boundary=True)  # Leave room for "-jules"
-        if len(repo_name) == 0:
-            repo_name = f"experiment-{int(time.time())}"
-        
-        # Append provider name to avoid conflicts when running same experiment on multiple providers
-        repo_name = f"{repo_name}-jules"
-
-        # Ensure uniqueness
-        base_name = repo_name
-        counter = 1
-        existing_repos = []  # In a real implementation, you might cache this
-        while f"{self.config.owner}/{repo_name}" in existing_repos:
-            repo_name = f"{base_name}-{counter}"
-            counter += 1
-
-        try:
-            # Sanitize description: remove control characters and newlines
-            raw_description = idea.idea[:140]
-            # Remove control characters and compress whitespace
-            sanitized_description = ' '.join(raw_description.split())[:140]
-            
-            repo_info = self.github.create_repo(
-                repo_name,
-                description=sanitized_description,
-                private=True
-            )
-
-            # Wait for repository initialization
-            time.sleep(2)
-
-            return repo_info['full_name'], repo_name, repo_info['default_branch']
-
-        except requests.HTTPError as e:
-            if e.response.status_code == 422:  # Repository might already exist or validation error
-                full_name = f"{self.config.owner}/{repo_name}"
-                
-                # Try to verify the repo actually exists (422 can mean other validation errors)
-                try:
-                    existing_repo_info = self.github.get_repo(full_name)
-                    default_branch = existing_repo_info['default_branch']
-                    logger.warning(f"Repository {full_name} already exists, using existing")
-                    logger.info(f"Existing repository default branch: {default_branch}")
-                    return full_name, repo_name, default_branch
-                except requests.HTTPError as fetch_error:
-                    if fetch_error.response.status_code == 404:
-                        # Repo doesn't exist - 422 error was from something else
-                        logger.error(f"Repository creation failed with 422, but repo doesn't exist at {full_name}")
-                        logger.error(f"Original 422 error response: {e.response.text[:200]}")
-                        raise e  # Re-raise the original 422 error
-                    else:
-                        raise fetch_error
-            else:
-                raise
-
-    def seed_repository(self, repo_full_name: str, idea: ExperimentIdea):
-        """Seed the repository with experiment templates and configuration for Jules."""
-        logger.info(f"Seeding repository: {repo_full_name}")
-
-        # Create temporary directory for file operations
-        with tempfile.TemporaryDirectory() as temp_dir:
-            repo_dir = Path(temp_dir) / 'repo'
-
-            # Copy template files to the repository
-            self._copy_template_files(repo_full_name, idea)
-
-            # Customize experiment configuration
-            self._customize_experiments(repo_full_name, idea)
-
-            logger.info(f"Repository {repo_full_name} seeded successfully for Jules")
-
-    def _copy_template_files(self, repo_full_name: str, idea: ExperimentIdea):
-        """Copy template files to the repository for Jules integration."""
-        template_dir = Path(__file__).parent / 'templates'
-
-        # Files to copy from templates
-        template_files = {
-            'AGENTS.md': 'AGENTS.md',
-            'experiments.yaml': 'experiments/manifest.yaml',
-            'runner.py': 'scripts/run_experiment.py',
-            'workflow.yml': '.github/workflows/run-experiments.yml'
-        }
-
-        for template_file, repo_path in template_files.items():
-            template_path = template_dir / template_file
-            if template_path.exists():
-                with open(template_path, 'r') as f:
-                    content = f.read()
-
-                # Basic templating - replace placeholders
-                content = content.replace('{{REPO_NAME}}', repo_full_name.split('/')[1])
-                content = content.replace('{{IDEA_TITLE}}', idea.title)
-                content = content.replace('{{IDEA_DESCRIPTION}}', idea.idea or '')
-
-                self.github.put_file(
-                    repo_full_name,
-                    repo_path,
-                    content,
-                    f'add {repo_path}'
-                )
-
-        # Add additional scaffold files
-        scaffold_files = {
-            'requirements.txt': self._generate_requirements(idea),
-            'experiments/idea.json': json.dumps({
-                'title': idea.title,
-                'idea': idea.idea,
-                'has_experiments': idea.has_experiments,
-                'experiments': idea.experiments,
-                'data_url': idea.data_url,
-                'timestamp': time.time(),
-                'jules_ready': True
-            }, indent=2),
-            'experiments/config.yaml': self._generate_config(idea),
-            'README.template.md': self._generate_readme_template(idea),
-            '.gitignore': self._generate_gitignore()
-        }
-
-        for file_path, content in scaffold_files.items():
-            self.github.put_file(
-                repo_full_name,
-                file_path,
-                content,
-                f'add {file_path}'
-            )
-
-    def _customize_experiments(self, repo_full_name: str, idea: ExperimentIdea):
-        """Customize the experiments manifest based on the idea."""
-        if idea.has_experiments and idea.experiments:
-            # Use the provided experiments configuration
-            self.github.put_file(
-                repo_full_name,
-                'experiments/manifest.yaml',
-                idea.experiments,
-                'add pre-defined experiments manifest'
-            )
-
-    def _generate_requirements(self, idea: ExperimentIdea) -> str:
-        """Generate requirements.txt content."""
-        base_reqs = [
-            'pandas',
-            'numpy',
-            'matplotlib',
-            'seaborn',
-            'scikit-learn',
-            'jupyter',
-            'pyyaml',
-            'tqdm',
-            'pytest'
-        ]
-
-        if idea.requirements:
-            # Add idea-specific requirements
-            additional_reqs = [req.strip() for req in idea.requirements.split(',')]
-            base_reqs.extend(additional_reqs)
-
-        return '\n'.join(base_reqs) + '\n'
-
-    def _generate_config(self, idea: ExperimentIdea) -> str:
-        """Generate experiment config.yaml."""
-        config = {
-            'random_seed': 42,
-            'log_level': 'INFO',
-            'output_dir': 'results',
-            'cache_dir': '.cache'
-        }
-
-        if idea.data_url:
-            config['data_url'] = idea.data_url
-
-        return yaml.safe_dump(config, sort_keys=False)
-
-    def _generate_readme_template(self, idea: ExperimentIdea) -> str:
-        """Generate a README template for Jules-managed repos."""
-        pipeline_type = "pre-defined experiments" if idea.has_experiments else "AI-planned experiments"
-        
-        return f'''# {idea.title}
-
-{idea.idea or "Experiment repository managed by Jules."}
-
-## Overview
-
-This repository contains a computational experiment designed to validate the idea: **{idea.title}**.
-
-**Pipeline Type:** {pipeline_type}
-
-{f"**Pre-defined Experiments:** This idea includes specific experiments to execute." if idea.has_experiments else "**AI Planning:** Jules will analyze the idea and generate a comprehensive experiment plan."}
-
-## Jules Integration
-
-This repository is configured for Jules asynchronous agent:
-
-1. **Jules session** started automatically via API
-2. **Plan approval** required before execution (configurable)
-3. **CI monitoring** Jules watches workflow runs and reads state.json
-4. **Auto-iteration** Jules adapts based on validation failures
-
-## Experiment Results
-
-Results and state will be stored in the `results/` directory:
-- `results/state.json` - Current step status and metrics
-- `results/validation_*.json` - Validation results per step
-- `results/logs/` - Execution logs
-
-## Getting Started
-
-Jules will:
-1. Review AGENTS.md and manifest.yaml
-2. {f"Validate and implement the provided experiment plan" if idea.has_experiments else "Design and implement a comprehensive experiment plan from scratch"}
-3. Trigger CI workflows and monitor results
-4. Iterate on failures based on state.json feedback
-5. Generate final README and RESULTS.md
-
-## Generated by Jules Orchestrator
-
-This repository was automatically created and configured using the Jules experiment orchestrator.
-Pipeline: {pipeline_type}
-Jules will handle the iterative improvement and final documentation generation.
-'''
+        return self._get_cached(f'{self.api_base}/sessions/{session_id}')
+
+
+# Static scaffold content shared by every seeded repository
+_BASE_REQUIREMENTS = (
+    'pandas',
+    'numpy',
+    'matplotlib',
+    'seaborn',
+    'scikit-learn',
+    'jupyter',
+    'pyyaml',
+    'tqdm',
+    'pytest'
+)
+_BASE_REQUIREMENTS_TEXT = '\n'.join(_BASE_REQUIREMENTS) + '\n'
 
-    def _generate_gitignore(self) -> str:
-        """Generate .gitignore content."""
-        return '''# Python
+_GITIGNORE = '''# Python
 __pycache__/
 *.py[cod]
 *$py.class
@@ -680,9 +819,67 @@ artifacts/**/__pycache__/
 .jules/
 '''
 
-    def _generate_results_quality_requirements(self) -> str:
-        """Generate comprehensive requirements for high-quality RESULTS.md"""
-        return """
+# README placeholders are filled with str.format; pipeline-specific wording is keyed by has_experiments
+_README_TEMPLATE = '''# {title}
+
+{description}
+
+## Overview
+
+This repository contains a computational experiment designed to validate the idea: **{title}**.
+
+**Pipeline Type:** {pipeline_type}
+
+{planning_note}
+
+## Jules Integration
+
+This repository is configured for Jules asynchronous agent:
+
+1. **Jules session** started automatically via API
+2. **Plan approval** required before execution (configurable)
+3. **CI monitoring** Jules watches workflow runs and reads state.json
+4. **Auto-iteration** Jules adapts based on validation failures
+
+## Experiment Results
+
+Results and state will be stored in the `results/` directory:
+- `results/state.json` - Current step status and metrics
+- `results/validation_*.json` - Validation results per step
+- `results/logs/` - Execution logs
+
+## Getting Started
+
+Jules will:
+1. Review AGENTS.md and manifest.yaml
+2. {plan_step}
+3. Trigger CI workflows and monitor results
+4. Iterate on failures based on state.json feedback
+5. Generate final README and RESULTS.md
+
+## Generated by Jules Orchestrator
+
+This repository was automatically created and configured using the Jules experiment orchestrator.
+Pipeline: {pipeline_type}
+Jules will handle the iterative improvement and final documentation generation.
+'''
+
+_README_PIPELINE_TEXT = {
+    True: {
+        'pipeline_type': 'pre-defined experiments',
+        'planning_note': '**Pre-defined Experiments:** This idea includes specific experiments to execute.',
+        'plan_step': 'Validate and implement the provided experiment plan'
+    },
+    False: {
+        'pipeline_type': 'AI-planned experiments',
+        'planning_note': '**AI Planning:** Jules will analyze the idea and generate a comprehensive experiment plan.',
+        'plan_step': 'Design and implement a comprehensive experiment plan from scratch'
+    }
+}
+
+
+# Guidance appended to every Jules prompt on what a good RESULTS.md contains
+_RESULTS_QUALITY_REQUIREMENTS = """
 ═══════════════════════════════════════════════════════════════════
 UNIVERSAL RESULTS.MD REQUIREMENTS (AUTO-ADAPT TO ANY TASK TYPE)
 ═══════════════════════════════════════════════════════════════════
@@ -882,24 +1079,12 @@ The learning curves indicate...
 REMEMBER: A good RESULTS.md tells a complete story with data, visuals, and insights!
 """
 
-    def start_jules_session(self, repo_full_name: str, idea: ExperimentIdea,
-                           default_branch: str = 'main',
-                           require_plan_approval: bool = True) -> str:
-        """Start a Jules session for the experiment."""
-        logger.info(f"Starting Jules session for {repo_full_name}")
-        logger.info(f"  Pipeline type: {'Pre-defined experiments' if idea.has_experiments else 'AI planning required'}")
-        logger.info(f"  Using branch: {default_branch}")
-
-        owner, repo = repo_full_name.split('/')
-
-        # Create comprehensive prompt for Jules based on pipeline type
-        if idea.has_experiments:
-            # Pre-defined experiments - Jules should validate and implement
-            prompt = f"""
-            Project: {idea.title}
 
-            Idea: {idea.idea}
+# Session prompts: only the project header varies per idea, the instructions below are constant.
 
+# Instructions for ideas that come with pre-defined experiments
+_PROMPT_PREDEFINED_BODY = (
+    """
             IMPORTANT: This idea comes with PRE-DEFINED EXPERIMENTS.
 
             Goal:
@@ -917,17 +1102,17 @@ REMEMBER: A good RESULTS.md tells a complete story with data, visuals, and insig
             - Upgrade README with: abstract, methods, results, error bars, limitations, next steps
             - Open a PR with all changes
 
-            {self._generate_results_quality_requirements()}
+            """
+    + _RESULTS_QUALITY_REQUIREMENTS
+    + """
 
             Execute the provided experiment plan faithfully. Sequential dependency between steps is critical.
             """
-        else:
-            # AI needs to plan experiments from scratch
-            prompt = f"""
-            Project: {idea.title}
-
-            Idea: {idea.idea}
+)
 
+# Instructions for ideas whose experiment plan Jules must design
+_PROMPT_AI_PLANNED_BODY = (
+    """
             IMPORTANT: You need to DESIGN THE EXPERIMENT PLAN from scratch.
 
             Goal:
@@ -946,10 +1131,326 @@ REMEMBER: A good RESULTS.md tells a complete story with data, visuals, and insig
             - Upgrade README with: abstract, methods, results, error bars, limitations, next steps
             - Open a PR with all changes
 
-            {self._generate_results_quality_requirements()}
+            """
+    + _RESULTS_QUALITY_REQUIREMENTS
+    + """
 
             Design a rigorous, falsifiable experiment plan. Sequential dependency between steps is critical.
             """
+)
+
+_PROMPT_BODIES = {True: _PROMPT_PREDEFINED_BODY, False: _PROMPT_AI_PLANNED_BODY}
+
+
+class JulesOrchestrator:
+    """Main orchestrator for creating and managing experiment repositories for Jules."""
+
+    def __init__(self, config: RepoConfig, jules_api_key: str):
+        self.config = config
+        self.github = GitHubClient(config.token, config.owner)
+        self.jules = JulesClient(jules_api_key)
+        self.state = StateCache(config.state_file)
+        self.sources = SourcesCache(self.jules.list_sources)
+        # Refreshes Jules sources in the background while a new repository is being seeded
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=2)
+
+        # Repo names claimed during this run, so ideas with the same title don't collide
+        self._used_repo_names: set = set()
+        self._repo_names_lock = threading.Lock()
+
+    def close(self):
+        """Release the API clients' connection pools."""
+        self._prefetch_pool.shutdown(wait=False)
+        self.github.close()
+        self.jules.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def load_ideas(self, input_path: str) -> List[ExperimentIdea]:
+        """
+        Load experiment ideas from CSV or Excel file.
+        
+        Expected columns:
+        - title: Experiment title
+        - has_experiments: Boolean (True/1 if experiments provided, False/0 if AI should plan)
+        - idea: Description of the idea
+        - experiments: Pre-defined experiments YAML (optional, used when has_experiments is True)
+        """
+        ideas = list(self.iter_ideas(input_path))
+        with_experiments = sum(idea.has_experiments for idea in ideas)
+
+        logger.info(f"Loaded {len(ideas)} experiment ideas")
+        logger.info(f"  - {with_experiments} with pre-defined experiments")
+        logger.info(f"  - {len(ideas) - with_experiments} requiring AI planning")
+        return ideas
+
+    def iter_ideas(self, input_path: str) -> Iterator[ExperimentIdea]:
+        """
+        Lazily yield experiment ideas from a CSV or Excel file.
+
+        CSV files are read row by row with the csv module and .xlsx files with openpyxl in
+        read-only mode, so large idea files never need to be held in memory at once. Legacy
+        .xls files are read whole with pandas, then yielded the same way.
+
+        Args:
+            input_path: Path to the CSV/Excel file (same columns as load_ideas)
+
+        Yields:
+            ExperimentIdea for each row, in file order
+        """
+        if input_path.endswith('.xls'):
+            import pandas as pd
+            yield from self._ideas_from_frame(pd.read_excel(input_path))
+            return
+
+        rows = _iter_xlsx_rows(input_path) if input_path.endswith('.xlsx') else _iter_csv_rows(input_path)
+        for index, row in enumerate(rows):
+            # Empty and NA-like cells become None, as they do when read through pandas
+            values = {column: row.get(column) for column in IDEA_COLUMNS}
+            values = {
+                column: None if isinstance(value, str) and value in _MISSING_CELL_VALUES else value
+                for column, value in values.items()
+            }
+            title = str(values['title']) if values['title'] is not None else f'Idea_{index}'
+            has_experiments = _parse_has_experiments(values['has_experiments'])
+            yield ExperimentIdea(
+                title=title,
+                idea=str(values['idea']) if values['idea'] is not None else '',
+                has_experiments=has_experiments,
+                experiments=values['experiments'] if has_experiments else None,
+                data_url=values['data_url'],
+                requirements=values['requirements'],
+                slug=_slugify_title(title, index)
+            )
+
+    def _ideas_from_frame(self, df: 'pd.DataFrame') -> List[ExperimentIdea]:
+        """Convert a DataFrame of idea rows into ExperimentIdea objects."""
+        import pandas as pd
+
+        # Normalize whole columns at once; missing optional columns become empty
+        df = df.reindex(columns=IDEA_COLUMNS)
+        default_titles = pd.Series([f'Idea_{i}' for i in range(len(df))], index=df.index)
+        df['title'] = df['title'].fillna(default_titles).astype(str)
+        df['idea'] = df['idea'].fillna('').astype(str)
+        df['has_experiments'] = df['has_experiments'].map(_parse_has_experiments)
+
+        # Empty cells become None rather than NaN (NaN is truthy and not valid JSON)
+        df = df.astype(object).where(df.notna(), None)
+
+        return [
+            ExperimentIdea(
+                title=title,
+                idea=idea,
+                has_experiments=has_experiments,
+                experiments=experiments if has_experiments else None,
+                data_url=data_url,
+                requirements=requirements,
+                slug=_slugify_title(title, index)
+            )
+            for index, (title, idea, has_experiments, experiments, data_url, requirements)
+            in enumerate(df.itertuples(index=False, name=None))
+        ]
+
+    def create_experiment_repo(self, idea: ExperimentIdea) -> Tuple[str, str, str]:
+        """Create a GitHub repository for an experiment idea.
+        
+        Returns:
+            Tuple of (full_name, repo_name, default_branch)
+        """
+        # Generate a clean repo name with provider suffix
+        if idea.slug is None:
+            idea.slug = _slugify_title(idea.title)
+        
+        # Append provider name to avoid conflicts when running same experiment on multiple providers
+        repo_name = f"{idea.slug}-jules"
+
+        # Ensure uniqueness within this run
+        with self._repo_names_lock:
+            base_name = repo_name
+            counter = 1
+            while repo_name in self._used_repo_names:
+                repo_name = f"{base_name}-{counter}"
+                counter += 1
+            self._used_repo_names.add(repo_name)
+
+        try:
+            # Sanitize description: remove control characters and newlines
+            raw_description = idea.idea[:140]
+            # Remove control characters and compress whitespace
+            sanitized_description = ' '.join(raw_description.split())[:140]
+            
+            repo_info = self.github.create_repo(
+                repo_name,
+                description=sanitized_description,
+                private=True
+            )
+
+            # auto_init commits asynchronously; wait until the default branch is there
+            self._wait_for_branch(repo_info['full_name'], repo_info['default_branch'])
+
+            return repo_info['full_name'], repo_name, repo_info['default_branch']
+
+        except requests.HTTPError as e:
+            if e.response.status_code == 422:  # Repository might already exist or validation error
+                full_name = f"{self.config.owner}/{repo_name}"
+                
+                # Try to verify the repo actually exists (422 can mean other validation errors)
+                try:
+                    existing_repo_info = self.github.get_repo(full_name)
+                    default_branch = existing_repo_info['default_branch']
+                    logger.warning(f"Repository {full_name} already exists, using existing")
+                    logger.info(f"Existing repository default branch: {default_branch}")
+                    return full_name, repo_name, default_branch
+                except requests.HTTPError as fetch_error:
+                    if fetch_error.response.status_code == 404:
+                        # Repo doesn't exist - 422 error was from something else
+                        logger.error(f"Repository creation failed with 422, but repo doesn't exist at {full_name}")
+                        logger.error(f"Original 422 error response: {e.response.text[:200]}")
+                        raise e  # Re-raise the original 422 error
+                    else:
+                        raise fetch_error
+            else:
+                raise
+
+    def _wait_for_branch(self, repo_full_name: str, branch: str):
+        """Poll with short, growing delays until a branch exists (about 3s at most)."""
+        for delay in BRANCH_POLL_DELAYS:
+            try:
+                self.github.get_branch(repo_full_name, branch)
+                return
+            except requests.HTTPError as e:
+                if e.response.status_code != 404:
+                    raise
+            time.sleep(delay)
+        logger.warning(f"Branch {branch} of {repo_full_name} not visible yet, continuing anyway")
+
+    def seed_repository(self, repo_full_name: str, idea: ExperimentIdea, branch: str):
+        """Seed the repository with experiment templates and configuration for Jules."""
+        logger.info(f"Seeding repository: {repo_full_name}")
+
+        # Collect template files for the repository
+        files = self._copy_template_files(repo_full_name, idea)
+
+        # Push everything as a single commit
+        self.github.commit_files(
+            repo_full_name,
+            branch,
+            files,
+            'chore: seed experiment scaffold'
+        )
+
+        logger.info(f"Repository {repo_full_name} seeded successfully for Jules")
+
+    def _copy_template_files(self, repo_full_name: str, idea: ExperimentIdea) -> Dict[str, str]:
+        """Build the template files for Jules integration, keyed by repository path."""
+        template_dir = Path(__file__).parent / 'templates'
+
+        # Files to copy from templates
+        template_files = {
+            'AGENTS.md': 'AGENTS.md',
+            'experiments.yaml': 'experiments/manifest.yaml',
+            'runner.py': 'scripts/run_experiment.py',
+            'workflow.yml': '.github/workflows/run-experiments.yml'
+        }
+
+        placeholders = {
+            'REPO_NAME': repo_full_name.split('/')[1],
+            'IDEA_TITLE': idea.title,
+            'IDEA_DESCRIPTION': idea.idea or ''
+        }
+
+        # Ideas that come with their own experiments replace the template instead of overwriting it
+        custom_experiments = idea.experiments if (idea.has_experiments and idea.experiments) else None
+
+        files = {}
+        for template_file, repo_path in template_files.items():
+            if template_file == 'experiments.yaml' and custom_experiments:
+                files[repo_path] = custom_experiments
+                continue
+
+            content = _load_template(template_dir / template_file)
+            if content is not None:
+                # Basic templating - replace placeholders
+                files[repo_path] = _PLACEHOLDER_RE.sub(lambda m: placeholders[m.group(1)], content)
+
+        # Add additional scaffold files
+        scaffold_files = {
+            'requirements.txt': self._generate_requirements(idea),
+            'experiments/idea.json': _dumps_json({
+                'title': idea.title,
+                'idea': idea.idea,
+                'has_experiments': idea.has_experiments,
+                'experiments': idea.experiments,
+                'data_url': idea.data_url,
+                'timestamp': time.time(),
+                'jules_ready': True
+            }),
+            'experiments/config.yaml': self._generate_config(idea),
+            'README.template.md': self._generate_readme_template(idea),
+            '.gitignore': self._generate_gitignore()
+        }
+
+        files.update(scaffold_files)
+        return files
+
+    def _generate_requirements(self, idea: ExperimentIdea) -> str:
+        """Generate requirements.txt content."""
+        if not idea.requirements:
+            return _BASE_REQUIREMENTS_TEXT
+
+        # Add idea-specific requirements
+        additional_reqs = [req.strip() for req in idea.requirements.split(',') if req.strip()]
+        return '\n'.join(_BASE_REQUIREMENTS + tuple(additional_reqs)) + '\n'
+
+    def _generate_config(self, idea: ExperimentIdea) -> str:
+        """Generate experiment config.yaml."""
+        config = {
+            'random_seed': 42,
+            'log_level': 'INFO',
+            'output_dir': 'results',
+            'cache_dir': '.cache'
+        }
+
+        if idea.data_url:
+            config['data_url'] = idea.data_url
+
+        import yaml
+        # libyaml's emitter when PyYAML was built with it; same output as safe_dump
+        dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+        return yaml.dump(config, Dumper=dumper, sort_keys=False)
+
+    def _generate_readme_template(self, idea: ExperimentIdea) -> str:
+        """Generate a README template for Jules-managed repos."""
+        return _README_TEMPLATE.format(
+            title=idea.title,
+            description=idea.idea or "Experiment repository managed by Jules.",
+            **_README_PIPELINE_TEXT[bool(idea.has_experiments)]
+        )
+
+    def _generate_gitignore(self) -> str:
+        """Generate .gitignore content."""
+        return _GITIGNORE
+
+    def start_jules_session(self, repo_full_name: str, idea: ExperimentIdea,
+                           default_branch: str = 'main',
+                           require_plan_approval: bool = True) -> str:
+        """Start a Jules session for the experiment."""
+        logger.info(f"Starting Jules session for {repo_full_name}")
+        logger.info(f"  Pipeline type: {'Pre-defined experiments' if idea.has_experiments else 'AI planning required'}")
+        logger.info(f"  Using branch: {default_branch}")
+
+        owner, repo = repo_full_name.split('/')
+
+        # Create comprehensive prompt for Jules based on pipeline type
+        prompt = f"""
+            Project: {idea.title}
+
+            Idea: {idea.idea}
+""" + _PROMPT_BODIES[bool(idea.has_experiments)]
 
         session_id = self.jules.create_session(
             owner=owner,
@@ -976,12 +1477,13 @@ REMEMBER: A good RESULTS.md tells a complete story with data, visuals, and insig
         """
         logger.info(f"Monitoring Jules session: {session_id}")
 
-        start_time = time.time()
-        timeout_seconds = timeout_minutes * 60
+        deadline = time.monotonic() + timeout_minutes * 60
 
         plan_approved = False
+        last_fingerprint = None
+        idle_polls = 0
 
-        while time.time() - start_time < timeout_seconds:
+        while time.monotonic() < deadline:
             # Get current activities
             activities = self.jules.list_activities(session_id)
 
@@ -1009,8 +1511,20 @@ REMEMBER: A good RESULTS.md tells a complete story with data, visuals, and insig
                     'pr_url': pr_url
                 }
 
-            logger.debug(f"Session {session_id} still in progress...")
-            time.sleep(30)  # Poll every 30 seconds
+            # Poll quickly while the session is changing, backing off while nothing happens
+            fingerprint = (len(activities), session.get('state'), repr(outputs))
+            if fingerprint != last_fingerprint:
+                last_fingerprint = fingerprint
+                idle_polls = 0
+            else:
+                idle_polls += 1
+
+            max_interval = SESSION_POLL_MAX_INTERVAL_BY_STATE.get(session.get('state'), SESSION_POLL_MAX_INTERVAL)
+            ceiling = min(max_interval, SESSION_POLL_MIN_INTERVAL * 2 ** min(idle_polls, 16))
+            delay = max(SESSION_POLL_MIN_SLEEP, random.uniform(0, ceiling))
+            delay = min(delay, max(0.0, deadline - time.monotonic()))
+            logger.debug("Session %s still in progress, next check in %.1fs...", session_id, delay)
+            time.sleep(delay)
 
         logger.warning(f"Session {session_id} monitoring timed out after {timeout_minutes} minutes")
         return {
@@ -1021,56 +1535,72 @@ REMEMBER: A good RESULTS.md tells a complete story with data, visuals, and insig
     def process_idea(self, idea: ExperimentIdea, require_plan_approval: bool = True) -> Dict[str, Any]:
         """Process a single experiment idea from start to finish."""
         logger.info(f"Processing idea: {idea.title}")
+        state_key = StateCache.key_for(idea)
+        progress = self.state.get(state_key)
+
+        if progress.get('session_id'):
+            logger.info(f"Session already started for {progress['repo']}, skipping")
+            return self._session_started_result(idea, progress['repo'], progress['session_id'])
 
         try:
             # 1. Create repository
-            repo_full_name, repo_name, default_branch = self.create_experiment_repo(idea)
+            if progress.get('repo'):
+                repo_full_name, default_branch = progress['repo'], progress['default_branch']
+                logger.info(f"Reusing repository from previous run: {repo_full_name}")
+            else:
+                repo_full_name, repo_name, default_branch = self.create_experiment_repo(idea)
+                self.state.update(state_key, repo=repo_full_name, default_branch=default_branch)
 
-            # 2. Seed with templates for Jules
-            self.seed_repository(repo_full_name, idea)
+            expected_source = f'sources/github/{repo_full_name}'
 
-            # Wait for Jules to index the new repository
-            logger.info("Waiting for Jules to index repository...")
-            time.sleep(20)  # Initial wait increased to 20 seconds
-            
-            # Verify the repository is available as a source (REQUIRED)
-            max_retries = 6  # Increased from 3 to 6 attempts
+            # 2. Seed with templates for Jules
+            if not progress.get('seeded'):
+                # Fetch the Jules sources while seeding; the check below then waits on the
+                # cache's lock instead of starting a second request
+                self._prefetch_pool.submit(self.sources.contains, expected_source)
+                self.seed_repository(repo_full_name, idea, default_branch)
+                self.state.update(state_key, seeded=True)
+
+            # Verify the repository is available as a source (REQUIRED). Check right away:
+            # the repo is often indexed already, and the backoff below covers the rest.
+            max_retries = SOURCE_POLL_ATTEMPTS
             repository_indexed = False
-            
+
             for attempt in range(max_retries):
                 try:
-                    sources = self.jules.list_sources()
-                    source_names = [s.get('name', '') for s in sources]
-                    expected_source = f'sources/github/{repo_full_name}'
-                    
-                    if expected_source in source_names:
+                    if self.sources.contains(expected_source):
                         logger.info(f"✓ Repository indexed and available as source")
                         repository_indexed = True
                         break
-                    else:
-                        if attempt < max_retries - 1:
-                            wait_time = 15  # Increased from 10 to 15 seconds between retries
-                            logger.warning(f"Repository not yet indexed, waiting {wait_time}s... (attempt {attempt + 1}/{max_retries})")
-                            time.sleep(wait_time)
-                        else:
-                            logger.error(f"Repository not indexed after {max_retries} attempts")
-                            raise Exception(
-                                f"Repository {repo_full_name} is not available in Jules sources after waiting. "
-                                f"This usually means:\n"
-                                f"1. The Jules GitHub App doesn't have access to this repository\n"
-                                f"2. The repository is still being indexed (try again in a few minutes)\n"
-                                f"3. There's an issue with the Jules service\n\n"
-                                f"Please ensure the Jules GitHub App is installed with access to 'All repositories' "
-                                f"or specifically includes this repository."
-                            )
+                    elif attempt == max_retries - 1:
+                        logger.error(f"Repository not indexed after {max_retries} attempts")
+                        raise Exception(
+                            f"Repository {repo_full_name} is not available in Jules sources after waiting. "
+                            f"This usually means:\n"
+                            f"1. The Jules GitHub App doesn't have access to this repository\n"
+                            f"2. The repository is still being indexed (try again in a few minutes)\n"
+                            f"3. There's an issue with the Jules service\n\n"
+                            f"Please ensure the Jules GitHub App is installed with access to 'All repositories' "
+                            f"or specifically includes this repository."
+                        )
+                    logger.warning(f"Repository not yet indexed (attempt {attempt + 1}/{max_retries})")
+                except requests.HTTPError as e:
+                    # A rejected key or missing endpoint won't fix itself; surface it now
+                    status = e.response.status_code if e.response is not None else None
+                    if status in (401, 403, 404):
+                        logger.error(f"Jules rejected the sources request (HTTP {status}), not retrying")
+                        raise
+                    logger.warning(f"Could not verify repository indexing (HTTP {status}), retrying: {e}")
                 except Exception as e:
                     if "not available in Jules sources" in str(e):
                         raise  # Re-raise our custom exception
                     logger.warning(f"Could not verify repository indexing: {e}")
                     # Don't break - keep trying
-                    if attempt < max_retries - 1:
-                        time.sleep(15)
-            
+
+                if attempt < max_retries - 1:
+                    delay = min(SOURCE_POLL_MAX_DELAY, SOURCE_POLL_BASE_DELAY * 2 ** attempt)
+                    time.sleep(random.uniform(delay / 2, delay))
+
             # Only proceed if repository is indexed
             if not repository_indexed:
                 raise Exception(f"Repository {repo_full_name} was never successfully indexed by Jules")
@@ -1082,19 +1612,13 @@ REMEMBER: A good RESULTS.md tells a complete story with data, visuals, and insig
                 default_branch=default_branch,
                 require_plan_approval=require_plan_approval
             )
+            self.state.update(state_key, session_id=session_id)
 
             # 4. Monitor session (optional - can run asynchronously)
             # In production, you might want to monitor or just return the session ID
             # session_result = self.monitor_session(session_id)
 
-            return {
-                'idea': idea.title,
-                'repo': repo_full_name,
-                'status': 'session_started',
-                'session_id': session_id,
-                'jules_ready': True,
-                'instructions': f'Jules session started. Monitor at: https://jules.google (session: {session_id})'
-            }
+            return self._session_started_result(idea, repo_full_name, session_id)
 
         except Exception as e:
             logger.error(f"Error processing idea {idea.title}: {e}")
@@ -1104,28 +1628,50 @@ REMEMBER: A good RESULTS.md tells a complete story with data, visuals, and insig
                 'error': str(e)
             }
 
-    def run_batch(self, ideas: List[ExperimentIdea], require_plan_approval: bool = True) -> List[Dict[str, Any]]:
+    def _session_started_result(self, idea: ExperimentIdea, repo_full_name: str, session_id: str) -> Dict[str, Any]:
+        """Build the process_idea result for an idea whose Jules session is running."""
+        return {
+            'idea': idea.title,
+            'repo': repo_full_name,
+            'status': 'session_started',
+            'session_id': session_id,
+            'jules_ready': True,
+            'instructions': f'Jules session started. Monitor at: https://jules.google (session: {session_id})'
+        }
+
+    def run_batch(self, ideas: Iterable[ExperimentIdea], require_plan_approval: bool = True) -> List[Dict[str, Any]]:
         """
         Process multiple ideas with concurrency control.
 
         Args:
-            ideas: List of experiment ideas
+            ideas: Experiment ideas (a list, or a lazy iterator such as iter_ideas)
             require_plan_approval: Whether to require plan approval for each session
 
         Returns:
-            List of processing results
+            List of processing results, in idea order
         """
+        # Look up the owner's account type once up front, so workers don't race to fetch it
+        try:
+            self.github._is_user_account()
+        except requests.RequestException as e:
+            logger.warning(f"Could not determine account type of {self.config.owner}: {e}")
+
+        # Ideas spend nearly all their time waiting on GitHub/Jules, so threads suffice.
+        # The pool size also respects Jules quotas on concurrent session creation
+        # (Free: 3 concurrent, Pro: 15 concurrent, Ultra: 60 concurrent)
+        logger.info(f"Processing ideas with up to {self.config.max_concurrent} concurrent workers")
         results = []
-
-        for idea in ideas:
-            result = self.process_idea(idea, require_plan_approval=require_plan_approval)
-            results.append(result)
-
-            # Respect Jules quotas (avoid hitting concurrent session limits)
-            # Free: 3 concurrent, Pro: 15 concurrent, Ultra: 60 concurrent
-            if len([r for r in results if r.get('status') == 'session_started']) >= self.config.max_concurrent:
-                logger.info(f"Reached concurrent limit ({self.config.max_concurrent}), pausing...")
-                time.sleep(5)
+        in_flight = deque()
+        with ThreadPoolExecutor(max_workers=self.config.max_concurrent) as executor:
+            # Only read ahead a little, so a large idea file is never fully materialized
+            for index, idea in enumerate(ideas):
+                if len(in_flight) >= self.config.max_concurrent * 2:
+                    results.append(in_flight.popleft().result())
+                elif 0 < index < self.config.max_concurrent:
+                    # Later ideas start as earlier ones finish, which spaces them naturally
+                    time.sleep(random.uniform(*IDEA_START_SPACING))
+                in_flight.append(executor.submit(self.process_idea, idea, require_plan_approval=require_plan_approval))
+            results.extend(future.result() for future in in_flight)
 
         return results
 
@@ -1154,6 +1700,11 @@ def main():
         action='store_true',
         help='Show what would be done without executing'
     )
+    parser.add_argument(
+        '--state-file',
+        default=None,
+        help='JSON file tracking progress so reruns skip completed work (off by default)'
+    )
 
     args = parser.parse_args()
 
@@ -1175,7 +1726,8 @@ def main():
     config = RepoConfig(
         owner=github_owner,
         token=github_token,
-        max_concurrent=args.max_concurrent
+        max_concurrent=args.max_concurrent,
+        state_file=args.state_file or None
     )
 
     # Initialize orchestrator
@@ -1183,25 +1735,24 @@ def main():
 
     if args.dry_run:
         logger.info("DRY RUN MODE - No actual changes will be made")
+        orchestrator.close()
         return
 
     try:
-        # Load ideas
-        ideas = orchestrator.load_ideas(args.input)
-
-        # Process ideas
-        logger.info(f"Starting batch processing of {len(ideas)} ideas for Jules")
+        # Process ideas as they are read from the input file
+        logger.info(f"Starting batch processing of ideas from {args.input} for Jules")
         logger.info(f"Max concurrent sessions: {args.max_concurrent}")
         logger.info(f"Plan approval: {'auto' if args.auto_approve else 'required'}")
 
         results = orchestrator.run_batch(
-            ideas,
+            orchestrator.iter_ideas(args.input),
             require_plan_approval=not args.auto_approve
         )
 
         # Summarize results
-        successful = [r for r in results if r.get('status') == 'session_started']
-        failed = [r for r in results if r.get('status') != 'session_started']
+        successful, failed = [], []
+        for result in results:
+            (successful if result.get('status') == 'session_started' else failed).append(result)
 
         logger.info(f"\nBatch processing completed:")
         logger.info(f"  Jules sessions started: {len(successful)}")
@@ -1210,12 +1761,12 @@ def main():
         if successful:
             logger.info("\nStarted sessions:")
             for result in successful:
-                logger.info(f"  - {result['repo']}: {result.get('session_id', 'N/A')}")
+                logger.info("  - %s: %s", result['repo'], result.get('session_id', 'N/A'))
 
         if failed:
             logger.warning("\nFailed repositories:")
             for result in failed:
-                logger.warning(f"  - {result['idea']}: {result.get('error', 'Unknown error')}")
+                logger.warning("  - %s: %s", result['idea'], result.get('error', 'Unknown error'))
 
         logger.info("\nNext steps:")
         logger.info("1. Monitor Jules sessions at https://jules.google")
@@ -1232,6 +1783,8 @@ def main():
     except Exception as e:
         logger.error(f"Orchestration failed: {e}")
         sys.exit(1)
+    finally:
+        orchestrator.close()
 
 
 if __name__ == '__main__':
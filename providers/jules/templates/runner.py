@@ -11,15 +11,32 @@ Usage:
 
 import argparse
 import json
+import operator
 import os
+import re
+import signal
 import subprocess
 import sys
+import threading
 import time
 import yaml
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Callable, Dict, Any, List, Optional, Tuple
 import logging
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+try:
+    import orjson  # Optional: faster JSON parsing and serialization
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -31,6 +48,113 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Only the last lines of a command's output are kept in memory; the full output goes to its log file
+OUTPUT_TAIL_LINES = 2000
+
+# Metric check conditions such as "> 0.1" or ">= 100"
+_CONDITION_RE = re.compile(r'\s*(<=|>=|<|>)\s*([-+0-9.eE]+)')
+_CONDITION_OPS = {
+    '>=': operator.ge,
+    '>': operator.gt,
+    '<=': operator.le,
+    '<': operator.lt
+}
+
+
+def dump_json(data: Any) -> bytes:
+    """Serialize data to indented JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def load_json(path: Path) -> Any:
+    """Parse a JSON file, using orjson when installed."""
+    if orjson is not None:
+        data = path.read_bytes()
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity tokens that json.dump writes by default
+            return json.loads(data)
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=None)
+def parse_condition(condition: str) -> Optional[Tuple[Callable[[float, float], bool], float]]:
+    """
+    Parse a metric condition into a comparison and its threshold.
+
+    Args:
+        condition: Condition string such as "> 0.1"
+
+    Returns:
+        Tuple of (compare, threshold), or None if the condition has no supported operator
+    """
+    match = _CONDITION_RE.search(condition)
+    if not match:
+        return None
+    return _CONDITION_OPS[match.group(1)], float(match.group(2))
+
+
+def stream_command(args, log_handle, timeout_seconds: float, label: str, **popen_kwargs) -> Tuple[int, str]:
+    """
+    Run a command, streaming its combined stdout/stderr to a log file.
+
+    Args:
+        args: Command to run (list, or string when shell=True is passed)
+        log_handle: Open text file that receives the full output
+        timeout_seconds: Wall-clock limit after which the command is killed
+        label: Prefix for lines echoed to the logger at DEBUG level
+        **popen_kwargs: Extra arguments for subprocess.Popen (cwd, env, shell, ...)
+
+    Returns:
+        Tuple of (exit_code: int, output_tail: str)
+
+    Raises:
+        subprocess.TimeoutExpired: If the command exceeded timeout_seconds
+    """
+    tail = deque(maxlen=OUTPUT_TAIL_LINES)
+    timed_out = threading.Event()
+
+    # Run in its own process group so a timeout also kills any children it spawned
+    process = subprocess.Popen(
+        args,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+        start_new_session=hasattr(os, 'killpg'),
+        **popen_kwargs
+    )
+
+    def kill():
+        timed_out.set()
+        if hasattr(os, 'killpg'):
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+
+    watchdog = threading.Timer(timeout_seconds, kill)
+    watchdog.daemon = True
+    watchdog.start()
+    try:
+        for line in process.stdout:
+            log_handle.write(line)
+            tail.append(line)
+            # The step log already has the output; echo it only when debugging the runner
+            logger.debug("[%s] %s", label, line.rstrip())
+        exit_code = process.wait()
+    finally:
+        watchdog.cancel()
+        process.stdout.close()
+
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(args, timeout_seconds, output=''.join(tail))
+
+    return exit_code, ''.join(tail)
+
 
 class ExperimentRunner:
     """Handles execution of experiment steps with validation and state tracking."""
@@ -45,11 +169,24 @@ class ExperimentRunner:
         """
         self.manifest_path = Path(manifest_path)
         self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.logs_dir = self.output_dir / "logs"
+        self.logs_dir.mkdir(parents=True, exist_ok=True)
+
+        # Child environment shared by every step; only EXPERIMENT_STEP differs per step
+        self._base_env = {**os.environ, 'PYTHONPATH': str(Path.cwd())}
 
         # Load experiment manifest
         with open(self.manifest_path, 'r') as f:
-            self.manifest = yaml.safe_load(f)
+            self.manifest = yaml.load(f, Loader=YamlLoader)
+
+        # Index steps and their validation checks once so lookups don't rescan the manifest.
+        # As with a scan, the first entry for an ID wins and entries without one are never matched.
+        self._steps_by_id: Dict[str, Dict] = {}
+        for step in self.manifest.get('steps', []):
+            self._steps_by_id.setdefault(step.get('id'), step)
+        self._checks_by_step: Dict[str, List] = {}
+        for val in self.manifest.get('validation', []):
+            self._checks_by_step.setdefault(val.get('step'), val.get('checks', []))
 
         logger.info(f"Loaded experiment manifest from {manifest_path}")
 
@@ -63,13 +200,7 @@ class ExperimentRunner:
         Returns:
             Tuple of (success: bool, state: dict)
         """
-        # Find the step configuration
-        step_config = None
-        for step in self.manifest.get('steps', []):
-            if step.get('id') == step_id:
-                step_config = step
-                break
-
+        step_config = self._steps_by_id.get(step_id)
         if not step_config:
             raise ValueError(f"Step '{step_id}' not found in manifest")
 
@@ -82,18 +213,15 @@ class ExperimentRunner:
         # This is a placeholder that delegates to step-specific scripts
         success, state = self._execute_step(step_config)
 
-        # Write state.json for Jules to read
-        state_file = self.output_dir / "state.json"
-        with open(state_file, 'w') as f:
-            json.dump(state, f, indent=2)
-
         # Run validation checks
         validation_passed = self._validate_step(step_id, step_config, state)
-
-        # Update state with validation results
         state['validation_passed'] = validation_passed
-        with open(state_file, 'w') as f:
-            json.dump(state, f, indent=2)
+
+        # Write state.json for Jules to read, atomically so it never sees a partial file
+        state_file = self.output_dir / "state.json"
+        tmp_file = state_file.with_name(state_file.name + '.tmp')
+        tmp_file.write_bytes(dump_json(state))
+        os.replace(tmp_file, state_file)
 
         logger.info(f"Step {step_id} completed. Success: {success}, Validation: {validation_passed}")
 
@@ -129,36 +257,27 @@ class ExperimentRunner:
             logger.info(f"Running script: {script_path}")
 
             try:
-                # Set environment variables
-                env = os.environ.copy()
-                env['PYTHONPATH'] = str(Path.cwd())
-                env['EXPERIMENT_STEP'] = step_id
-
-                # Run the step-specific script
-                result = subprocess.run(
-                    [sys.executable, str(script_path)],
-                    capture_output=True,
-                    text=True,
-                    timeout=step_config.get('resources', {}).get('expected_duration_minutes', 60) * 60,
-                    env=env
-                )
-
-                success = result.returncode == 0
-                output = result.stdout + result.stderr
-
-                # Save output log
-                log_file = self.output_dir / "logs" / f"{step_id}.log"
-                log_file.parent.mkdir(parents=True, exist_ok=True)
+                env = {**self._base_env, 'EXPERIMENT_STEP': step_id}
+
+                # Run the step-specific script, streaming output to its log
+                log_file = self.logs_dir / f"{step_id}.log"
                 with open(log_file, 'w') as f:
                     f.write(f"Step: {step_id}\n")
-                    f.write(f"Exit code: {result.returncode}\n")
                     f.write("Output:\n")
-                    f.write(output)
-                    f.write("\n")
+                    exit_code, output = stream_command(
+                        [sys.executable, str(script_path)],
+                        f,
+                        timeout_seconds=step_config.get('resources', {}).get('expected_duration_minutes', 60) * 60,
+                        label=step_id,
+                        env=env
+                    )
+                    f.write(f"\nExit code: {exit_code}\n")
+
+                success = exit_code == 0
 
                 state['status'] = 'ok' if success else 'failed'
-                state['exit_code'] = result.returncode
-                state['output_summary'] = output[:500]  # First 500 chars
+                state['exit_code'] = exit_code
+                state['output_summary'] = output[-500:]  # Last 500 chars, where errors usually are
 
                 return success, state
 
@@ -192,12 +311,7 @@ class ExperimentRunner:
         Returns:
             True if all validations pass
         """
-        # Find validation rules for this step
-        validations = []
-        for val in self.manifest.get('validation', []):
-            if val.get('step') == step_id:
-                validations = val.get('checks', [])
-                break
+        validations = self._checks_by_step.get(step_id, [])
 
         if not validations:
             logger.info(f"No validation checks defined for step {step_id}")
@@ -205,6 +319,9 @@ class ExperimentRunner:
 
         all_passed = True
         validation_results = []
+        # Several checks usually refer to the same file; parse and stat each one only once
+        metric_files = self._load_metric_files(validations)
+        path_exists: Dict[str, bool] = {}
 
         for check in validations:
             check_type = check.get('type')
@@ -213,35 +330,29 @@ class ExperimentRunner:
             try:
                 if check_type == 'file_exists':
                     path = Path(check['path'])
-                    passed = path.exists()
+                    if check['path'] not in path_exists:
+                        path_exists[check['path']] = check['path'] in metric_files or path.exists()
+                    passed = path_exists[check['path']]
                     message = f"File {path} {'exists' if passed else 'does not exist'}"
 
                 elif check_type == 'metric':
                     path = Path(check['path'])
-                    if path.exists():
-                        with open(path, 'r') as f:
-                            data = json.load(f)
+                    if check['path'] not in metric_files and path.exists():
+                        # Unreadable file: load it here so the error is reported for this check
+                        metric_files[check['path']] = load_json(path)
+
+                    if check['path'] in metric_files:
+                        data = metric_files[check['path']]
 
                         key = check['key']
                         condition = check['condition']
 
                         if key in data:
                             value = data[key]
-                            # Parse condition (e.g., "> 0.1", ">= 100")
-                            if '>' in condition:
-                                if '>=' in condition:
-                                    threshold = float(condition.split('>=')[1].strip())
-                                    passed = float(value) >= threshold
-                                else:
-                                    threshold = float(condition.split('>')[1].strip())
-                                    passed = float(value) > threshold
-                            elif '<' in condition:
-                                if '<=' in condition:
-                                    threshold = float(condition.split('<=')[1].strip())
-                                    passed = float(value) <= threshold
-                                else:
-                                    threshold = float(condition.split('<')[1].strip())
-                                    passed = float(value) < threshold
+                            parsed = parse_condition(condition)
+                            if parsed:
+                                compare, threshold = parsed
+                                passed = compare(float(value), threshold)
                             else:
                                 passed = False
 
@@ -268,16 +379,37 @@ class ExperimentRunner:
 
         # Save validation results
         validation_file = self.output_dir / f"validation_{step_id}.json"
-        with open(validation_file, 'w') as f:
-            json.dump({
-                'step': step_id,
-                'checks': validation_results,
-                'all_passed': all_passed,
-                'timestamp': time.time()
-            }, f, indent=2)
+        validation_file.write_bytes(dump_json({
+            'step': step_id,
+            'checks': validation_results,
+            'all_passed': all_passed,
+            'timestamp': time.time()
+        }))
 
         return all_passed
 
+    @staticmethod
+    def _load_metric_files(checks: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Read every JSON file referenced by metric checks, once per distinct path.
+
+        Files that are missing or unreadable are left out, so the individual check
+        reports the problem exactly as it would without the cache.
+
+        Args:
+            checks: Validation checks for a step
+
+        Returns:
+            Mapping of path to parsed JSON data
+        """
+        metric_files = {}
+        for path in {check['path'] for check in checks if check.get('type') == 'metric' and 'path' in check}:
+            try:
+                metric_files[path] = load_json(Path(path))
+            except (OSError, ValueError):
+                continue
+        return metric_files
+
 
 def main():
     """Main entry point for the experiment runner."""
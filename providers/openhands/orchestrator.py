@@ -19,21 +19,37 @@ This orchestrator sets up repositories and starts conversations that OpenHands m
 """
 
 import argparse
-import base64
+import binascii
+import csv
+import hashlib
 import json
+import math
 import os
+import random
+import re
 import sys
+import threading
 import time
-import tempfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Any, Tuple
 from dataclasses import dataclass
 import logging
 
-import pandas as pd
 import requests
-import yaml
+from requests.adapters import HTTPAdapter
 from slugify import slugify
+from urllib3.util.retry import Retry
+
+try:
+    import orjson  # Optional: faster JSON serialization
+except ImportError:
+    orjson = None
+
+if TYPE_CHECKING:
+    import pandas as pd  # Imported lazily at runtime; only needed for Excel idea files
 
 # Configure logging
 logging.basicConfig(
@@ -46,8 +62,110 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# GitHub rate-limit handling: waits double from RATE_LIMIT_BASE_DELAY, so 12 attempts
+# cover roughly one hour - the length of GitHub's primary rate-limit window.
+RATE_LIMIT_BASE_DELAY = 1.0
+RATE_LIMIT_MAX_ATTEMPTS = 12
+# GitHub asks clients to wait at least a minute after a secondary rate limit without Retry-After
+SECONDARY_RATE_LIMIT_WAIT = 60.0
+# Random extra wait so concurrent workers don't all retry at the same instant
+RATE_LIMIT_JITTER = 1.0
+# Below this many remaining requests, calls are spread evenly over the rest of the window
+RATE_LIMIT_LOW_WATERMARK = 50
 
-@dataclass
+# Default seconds between conversation status polls (a larger X-Poll-Interval from the server wins)
+CONVERSATION_POLL_INTERVAL = 30
+# While a polled conversation's status stays the same, the wait grows by this factor up to
+# the maximum, with +/-20% jitter; any status change drops it back to the base interval
+CONVERSATION_POLL_BACKOFF = 1.5
+CONVERSATION_POLL_MAX_INTERVAL = 300
+# Conversation statuses at which monitoring stops
+FINISHED_CONVERSATION_STATUSES = ('idle', 'completed', 'error')
+
+# Keep-alive connections per host; sized for many concurrent ideas talking to GitHub at once
+HTTP_POOL_MAXSIZE = 32
+
+# Cap on GitHub requests in flight across all threads, to stay under the secondary rate limits
+GITHUB_MAX_IN_FLIGHT = 10
+
+# Columns read from the ideas spreadsheet, in ExperimentIdea field order
+IDEA_COLUMNS = ['title', 'idea', 'has_experiments', 'experiments', 'data_url', 'requirements']
+
+# Cell strings pandas reads as missing by default (its na_values); the csv/openpyxl path matches them
+_MISSING_CELL_VALUES = frozenset((
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null'
+))
+
+# Spreadsheet strings treated as true in the has_experiments column
+_TRUE_VALUES = frozenset(('true', '1', 'yes', 'y', 't'))
+
+# Per-idea dataclasses use __slots__ where dataclasses support it (Python 3.10+)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Template placeholders, substituted in a single pass over each template
+_PLACEHOLDER_RE = re.compile(r'\{\{(REPO_NAME|IDEA_TITLE|IDEA_DESCRIPTION)\}\}')
+
+# Fast path for slugs: short titles made only of these characters slugify to the same result
+# as python-slugify with a couple of regex passes (digit-grouping commas are dropped, as it does)
+_SIMPLE_TITLE_RE = re.compile(r'[A-Za-z0-9 ,.:;!?()/_\-]{0,70}')
+_DIGIT_COMMA_RE = re.compile(r'(?<=\d),(?=\d)')
+_SLUG_SEPARATOR_RE = re.compile(r'[^a-z0-9]+')
+
+
+def _dumps_json(data: Any) -> str:
+    """Serialize data as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(data, indent=2)
+
+
+@lru_cache(maxsize=None)
+def _load_template(template_path: Path) -> Optional[str]:
+    """Read a template file once per run; returns None if it doesn't exist."""
+    if not template_path.exists():
+        return None
+    return template_path.read_text()
+
+
+def _iter_csv_rows(path: str) -> Iterator[Dict[str, Any]]:
+    """Yield the rows of a CSV file as dicts keyed by header."""
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        yield from csv.DictReader(f)
+
+
+def _iter_xlsx_rows(path: str) -> Iterator[Dict[str, Any]]:
+    """Stream the rows of a workbook's first sheet as dicts keyed by header (blank rows skipped)."""
+    import openpyxl
+
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        for values in rows:
+            if any(value is not None for value in values):
+                yield dict(zip(header, values))
+    finally:
+        workbook.close()
+
+
+def _b64encode(data: bytes) -> str:
+    """Base64-encode file content for the Contents API."""
+    return binascii.b2a_base64(data, newline=False).decode('ascii')
+
+
+def _parse_has_experiments(value: Any) -> bool:
+    """Parse the has_experiments column (handles various boolean representations)."""
+    if isinstance(value, str):
+        return value.strip().lower() in _TRUE_VALUES
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return False
+    return bool(value)
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ExperimentIdea:
     """Represents an experiment idea from the input CSV/Excel."""
     title: str
@@ -56,6 +174,16 @@ class ExperimentIdea:
     experiments: Optional[str] = None  # Pre-defined experiments YAML (if has_experiments is True)
     data_url: Optional[str] = None
     requirements: Optional[str] = None
+    slug: Optional[str] = None  # Repo-safe title, computed once when the idea is read
+
+
+def _slugify_title(title: str, index: int = 0) -> str:
+    """Build a repository-safe slug for an idea title, leaving room for the provider suffix."""
+    if _SIMPLE_TITLE_RE.fullmatch(title):
+        slug = _SLUG_SEPARATOR_RE.sub('-', _DIGIT_COMMA_RE.sub('', title.lower())).strip('-')
+    else:
+        slug = slugify(title, max_length=70, word_boundary=True)
+    return slug or f"experiment-{int(time.time())}-{index}"
 
 
 @dataclass
@@ -64,6 +192,47 @@ class RepoConfig:
     owner: str
     token: str
     max_concurrent: int = 3
+    state_file: Optional[str] = None  # JSON file recording per-idea progress for resuming runs
+
+
+class StateCache:
+    """
+    Persistent record of the phases each idea has completed, so an interrupted run can resume.
+
+    Entries are keyed by a hash of the idea's title and description and stored as JSON,
+    rewritten atomically after every update. A cache without a path only lives in memory.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = Path(path) if path else None
+        self._lock = threading.Lock()
+        self._state: Dict[str, Dict[str, Any]] = {}
+
+        if self.path and self.path.exists():
+            with open(self.path, 'r') as f:
+                self._state = json.load(f)
+            logger.info(f"Loaded state for {len(self._state)} ideas from {self.path}")
+
+    @staticmethod
+    def key_for(idea: ExperimentIdea) -> str:
+        """Stable key identifying an idea across runs."""
+        raw = f'{idea.title}\n{idea.idea}'.encode('utf-8')
+        return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Dict[str, Any]:
+        """Return a copy of the recorded state for an idea (empty if unseen)."""
+        with self._lock:
+            return dict(self._state.get(key, {}))
+
+    def update(self, key: str, **fields: Any):
+        """Record completed-phase fields for an idea and flush to disk."""
+        with self._lock:
+            self._state.setdefault(key, {}).update(fields)
+            if self.path:
+                tmp_path = self.path.with_name(self.path.name + '.tmp')
+                with open(tmp_path, 'w') as f:
+                    json.dump(self._state, f, indent=2)
+                os.replace(tmp_path, self.path)
 
 
 class GitHubClient:
@@ -78,8 +247,100 @@ class GitHubClient:
             'Accept': 'application/vnd.github+json',
             'X-GitHub-Api-Version': '2022-11-28'
         })
+        # Retry transient server/network errors with exponential backoff
+        retry = Retry(
+            total=8,
+            backoff_factor=2.8,
+            status_forcelist=[500, 502, 503, 504],
+            allowed_methods=frozenset(['GET', 'POST', 'PUT', 'PATCH']),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        self.session.mount('https://', HTTPAdapter(max_retries=retry, pool_maxsize=HTTP_POOL_MAXSIZE))
         self.api_base = 'https://api.github.com'
 
+        # The owner is fixed for a run, so its account type only needs looking up once
+        self._is_user_cache: Optional[bool] = None
+        # Repository metadata keyed by full name, filled from create/get responses
+        self._repo_meta_cache: Dict[str, Dict[str, Any]] = {}
+        # Shared by every thread using this client; not held while sleeping off a rate limit
+        self._in_flight = threading.BoundedSemaphore(GITHUB_MAX_IN_FLIGHT)
+        # Earliest time (time.monotonic) the next request may go out while the quota is low
+        self._pace_lock = threading.Lock()
+        self._next_request_at = 0.0
+
+    def close(self):
+        """Close the pooled HTTP connections held by this client."""
+        self.session.close()
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request, waiting out GitHub rate limits (403/429) before giving up."""
+        # Serialize JSON bodies once up front (with orjson when available) rather than per attempt
+        if 'json' in kwargs:
+            payload = kwargs.pop('json')
+            kwargs['data'] = orjson.dumps(payload) if orjson is not None else json.dumps(payload).encode('utf-8')
+            kwargs['headers'] = {**kwargs.get('headers', {}), 'Content-Type': 'application/json'}
+
+        delay = RATE_LIMIT_BASE_DELAY
+        for attempt in range(RATE_LIMIT_MAX_ATTEMPTS):
+            with self._in_flight:
+                response = self.session.request(method, url, **kwargs)
+            if response.status_code not in (403, 429):
+                self._throttle(response)
+                return response
+            if attempt == RATE_LIMIT_MAX_ATTEMPTS - 1:
+                return response
+
+            wait = self._rate_limit_wait(response)
+            if wait is None:
+                # A plain 403 (e.g. missing permissions) - retrying won't help
+                return response
+
+            wait = max(wait, delay) + random.uniform(0, RATE_LIMIT_JITTER)
+            logger.warning(f"GitHub rate limit hit ({response.status_code}), "
+                           f"retrying in {wait:.0f}s (attempt {attempt + 1}/{RATE_LIMIT_MAX_ATTEMPTS})")
+            time.sleep(wait)
+            delay *= 2
+
+        return response
+
+    def _throttle(self, response: requests.Response):
+        """Slow down before the quota runs out, pacing the remaining requests until the reset.
+
+        The pace is shared by every thread using this client: each caller reserves the next
+        free slot, so concurrent workers together spend the quota at the intended rate.
+        """
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        if remaining is None or int(remaining) >= RATE_LIMIT_LOW_WATERMARK:
+            return
+
+        reset_wait = int(response.headers.get('X-RateLimit-Reset', 0)) - time.time()
+        if reset_wait > 0:
+            interval = reset_wait / max(int(remaining), 1)
+            with self._pace_lock:
+                now = time.monotonic()
+                self._next_request_at = max(now, self._next_request_at) + interval
+                pause = self._next_request_at - now
+            logger.debug("GitHub rate limit low (%s left), pausing %.1fs", remaining, pause)
+            time.sleep(pause)
+
+    @staticmethod
+    def _rate_limit_wait(response: requests.Response) -> Optional[float]:
+        """Seconds to wait for a rate-limited response, or None if it isn't rate limiting."""
+        headers = response.headers
+        retry_after = headers.get('Retry-After')
+        if headers.get('X-RateLimit-Remaining') == '0':
+            # Primary limit: the quota is spent until the window resets
+            reset_wait = int(headers.get('X-RateLimit-Reset', 0)) - time.time()
+            return max(reset_wait, float(retry_after or 0), 1.0)
+
+        # Secondary limit: X-RateLimit-Reset is sent on every response, so it says nothing here
+        if retry_after is not None:
+            return max(float(retry_after), 1.0)
+        if response.status_code == 429 or 'secondary rate limit' in response.text.lower():
+            return SECONDARY_RATE_LIMIT_WAIT
+        return None
+
     def create_repo(self, name: str, description: str = "", private: bool = True) -> Dict[str, Any]:
         """Create a new GitHub repository and return repo data including default branch."""
         url = f'{self.api_base}/orgs/{self.owner}/repos'
@@ -93,7 +354,7 @@ class GitHubClient:
             'auto_init': False
         }
 
-        response = self.session.post(url, json=payload)
+        response = self._request('POST', url, json=payload)
         response.raise_for_status()
 
         repo_data = response.json()
@@ -103,60 +364,154 @@ class GitHubClient:
         logger.info(f"Created repository: {full_name}")
         logger.info(f"Default branch: {default_branch}")
         
-        return {
+        repo_info = {
             'full_name': full_name,
             'default_branch': default_branch,
             'repo_data': repo_data
         }
+        self._repo_meta_cache[full_name] = repo_info
+        return repo_info
 
     def _is_user_account(self) -> bool:
-        """Check if the owner is a user account vs organization."""
-        url = f'{self.api_base}/users/{self.owner}'
-        response = self.session.get(url)
-        response.raise_for_status()
-        return response.json()['type'] == 'User'
+        """Check if the owner is a user account vs organization (cached per client)."""
+        if self._is_user_cache is None:
+            url = f'{self.api_base}/users/{self.owner}'
+            response = self._request('GET', url)
+            response.raise_for_status()
+            self._is_user_cache = response.json()['type'] == 'User'
+        return self._is_user_cache
     
-    def get_repo(self, repo_full_name: str) -> Dict[str, Any]:
-        """Get repository information including default branch."""
+    def get_repo(self, repo_full_name: str, refresh: bool = False) -> Dict[str, Any]:
+        """Get repository information including default branch.
+
+        Results are cached per repository; pass refresh=True to force a new lookup.
+        """
+        if not refresh and repo_full_name in self._repo_meta_cache:
+            return self._repo_meta_cache[repo_full_name]
+
         url = f'{self.api_base}/repos/{repo_full_name}'
-        response = self.session.get(url)
+        response = self._request('GET', url)
         response.raise_for_status()
         
         repo_data = response.json()
-        return {
+        repo_info = {
             'full_name': repo_data['full_name'],
             'default_branch': repo_data.get('default_branch', 'main'),
             'repo_data': repo_data
         }
+        self._repo_meta_cache[repo_full_name] = repo_info
+        return repo_info
+
+    def get_branch(self, repo_full_name: str, branch: str) -> Dict[str, Any]:
+        """Get a branch, including its head commit and that commit's tree."""
+        response = self._request('GET', f'{self.api_base}/repos/{repo_full_name}/branches/{branch}')
+        response.raise_for_status()
+        return response.json()
 
     def put_file(self, repo_full_name: str, path: str, content: str, message: str) -> Dict[str, Any]:
-        """Create or update a file in the repository."""
+        """Create or update a file in the repository.
+
+        The file is optimistically created first; only if GitHub reports that it already
+        exists is its SHA fetched and the update retried.
+        """
         url = f'{self.api_base}/repos/{repo_full_name}/contents/{path}'
 
         # Encode content as base64
-        content_b64 = base64.b64encode(content.encode('utf-8')).decode('utf-8')
+        content_b64 = _b64encode(content.encode('utf-8'))
 
         payload = {
             'message': message,
             'content': content_b64
         }
 
-        # Check if file exists and get its SHA if it does
-        try:
-            existing = self.session.get(url)
-            if existing.status_code == 200:
-                sha = existing.json()['sha']
-                payload['sha'] = sha
-                logger.debug(f"File {path} exists, updating with SHA {sha[:7]}...")
-        except Exception:
-            # File doesn't exist, we'll create it
-            pass
-
-        response = self.session.put(url, json=payload)
+        response = self._request('PUT', url, json=payload)
+
+        # An existing file needs its current SHA to be updated
+        if response.status_code == 409 or (response.status_code == 422 and 'sha' in response.text):
+            existing = self._request('GET', url)
+            existing.raise_for_status()
+            sha = existing.json()['sha']
+            payload['sha'] = sha
+            logger.debug("File %s exists, updating with SHA %.7s...", path, sha)
+            response = self._request('PUT', url, json=payload)
+
         response.raise_for_status()
 
         return response.json()
 
+    def commit_files(self, repo_full_name: str, branch: str, files: Dict[str, str], message: str) -> str:
+        """Commit several files to a branch as a single commit using the Git Data API.
+
+        Instead of one Contents API round-trip (plus an existence check) per file, this
+        creates one tree with the file contents inline, one commit, and updates the ref.
+        Files whose git blob SHA already matches the branch tree are left out of the tree,
+        and no commit is created when nothing changed.
+
+        Args:
+            repo_full_name: Full repository name (owner/repo)
+            branch: Branch to commit to (must already exist)
+            files: Mapping of repository path to file content
+            message: Commit message
+
+        Returns:
+            SHA of the new commit (or the current head if nothing changed)
+        """
+        repo_url = f'{self.api_base}/repos/{repo_full_name}'
+
+        # Resolve the current head of the branch and its tree in one call
+        head = self.get_branch(repo_full_name, branch)['commit']
+        parent_sha = head['sha']
+        base_tree_sha = head['commit']['tree']['sha']
+
+        response = self._request('GET', f'{repo_url}/git/trees/{base_tree_sha}', params={'recursive': '1'})
+        response.raise_for_status()
+        remote_shas = {
+            entry['path']: entry['sha']
+            for entry in response.json().get('tree', [])
+            if entry.get('type') == 'blob'
+        }
+
+        # Only send files whose content differs from what is already on the branch
+        changed = {
+            path: content
+            for path, content in files.items()
+            if remote_shas.get(path) != self._git_blob_sha(content.encode('utf-8'))
+        }
+
+        if not changed:
+            logger.debug("No changes to commit to %s@%s", repo_full_name, branch)
+            return parent_sha
+
+        # Text content inline in the tree lets GitHub create the blobs, saving a POST per file
+        tree = [
+            {'path': path, 'mode': '100644', 'type': 'blob', 'content': content}
+            for path, content in changed.items()
+        ]
+        response = self._request('POST', f'{repo_url}/git/trees',
+                                 json={'base_tree': base_tree_sha, 'tree': tree})
+        response.raise_for_status()
+        tree_sha = response.json()['sha']
+
+        response = self._request('POST', f'{repo_url}/git/commits', json={
+            'message': message,
+            'tree': tree_sha,
+            'parents': [parent_sha]
+        })
+        response.raise_for_status()
+        commit_sha = response.json()['sha']
+
+        response = self._request('PATCH', f'{repo_url}/git/refs/heads/{branch}', json={'sha': commit_sha})
+        response.raise_for_status()
+
+        logger.debug("Committed %d/%d files to %s@%s (%.7s)", len(changed), len(files), repo_full_name, branch, commit_sha)
+        return commit_sha
+
+    @staticmethod
+    def _git_blob_sha(data: bytes) -> str:
+        """Compute the SHA-1 git assigns to a blob with this content."""
+        header = f'blob {len(data)}\0'.encode('utf-8')
+        return hashlib.sha1(header + data).hexdigest()
+
 
 class OpenHandsClient:
     """Client for OpenHands Cloud API operations."""
@@ -168,8 +523,28 @@ class OpenHandsClient:
             'Authorization': f'Bearer {api_key}',
             'Content-Type': 'application/json'
         })
+        # Retry throttling and transient server errors on reads only; a retried POST
+        # could start a duplicate conversation or send a message twice
+        retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset(['GET']),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        self.session.mount('https://', HTTPAdapter(max_retries=retry, pool_maxsize=HTTP_POOL_MAXSIZE))
         self.api_base = 'https://app.all-hands.dev/api'
 
+        # Last (ETag, status data) per conversation, for conditional GETs
+        self._status_cache: Dict[str, Tuple[Optional[str], Dict[str, Any]]] = {}
+        # Server-suggested poll interval per conversation (X-Poll-Interval header)
+        self._poll_intervals: Dict[str, float] = {}
+
+    def close(self):
+        """Close the pooled HTTP connections held by this client."""
+        self.session.close()
+
     def start_conversation(self, repo_full_name: str, initial_message: str) -> str:
         """
         Start a new OpenHands Cloud conversation.
@@ -226,9 +601,44 @@ class OpenHandsClient:
         Returns:
             Conversation status data
         """
-        response = self.session.get(f'{self.api_base}/conversations/{conversation_id}')
+        etag, cached = self._status_cache.get(conversation_id, (None, None))
+        headers = {'If-None-Match': etag} if etag else {}
+
+        response = self.session.get(f'{self.api_base}/conversations/{conversation_id}', headers=headers)
+        if 'X-Poll-Interval' in response.headers:
+            # A malformed hint is ignored; polling keeps its current interval
+            try:
+                poll_interval = float(response.headers['X-Poll-Interval'])
+            except ValueError:
+                logger.debug("Ignoring invalid X-Poll-Interval %r", response.headers['X-Poll-Interval'])
+            else:
+                if math.isfinite(poll_interval):
+                    self._poll_intervals[conversation_id] = poll_interval
+
+        if response.status_code == 304 and cached is not None:
+            # Nothing changed since the last poll
+            return cached
+
         response.raise_for_status()
-        return response.json()
+        status = response.json()
+        self._status_cache[conversation_id] = (response.headers.get('ETag'), status)
+        return status
+
+    def suggested_poll_interval(self, conversation_id: str) -> float:
+        """Seconds to wait before polling a conversation again (honours X-Poll-Interval)."""
+        return max(self._poll_intervals.get(conversation_id, 0), CONVERSATION_POLL_INTERVAL)
+
+    def next_poll_delay(self, conversation_id: str, delay: float, status_changed: bool) -> float:
+        """
+        Delay before the next poll of a conversation, before jitter.
+
+        A status change drops back to the suggested interval; while the status stays the same
+        the delay grows by CONVERSATION_POLL_BACKOFF up to CONVERSATION_POLL_MAX_INTERVAL.
+        """
+        base = self.suggested_poll_interval(conversation_id)
+        if status_changed:
+            return base
+        return max(base, min(delay * CONVERSATION_POLL_BACKOFF, CONVERSATION_POLL_MAX_INTERVAL))
 
     def poll_conversation(self, conversation_id: str, timeout_minutes: int = 300) -> Dict[str, Any]:
         """
@@ -241,311 +651,163 @@ class OpenHandsClient:
         Returns:
             Final conversation status
         """
-        start_time = time.time()
-        timeout_seconds = timeout_minutes * 60
+        deadline = time.monotonic() + timeout_minutes * 60
+        last_status = None
+        delay = 0.0
 
-        while time.time() - start_time < timeout_seconds:
+        while time.monotonic() < deadline:
             status = self.get_conversation_status(conversation_id)
             conversation_status = status.get('status', '')
 
-            if conversation_status in ('idle', 'completed', 'error'):
+            if conversation_status in FINISHED_CONVERSATION_STATUSES:
                 logger.info(f"Conversation {conversation_id} finished with status: {conversation_status}")
                 return status
 
-            logger.debug(f"Conversation {conversation_id} status: {conversation_status}")
-            time.sleep(30)  # Poll every 30 seconds
+            status_changed = conversation_status != last_status
+            if status_changed:
+                logger.debug("Conversation %s status: %s", conversation_id, conversation_status)
+                last_status = conversation_status
+            delay = self.next_poll_delay(conversation_id, delay, status_changed)
+
+            wait = delay * random.uniform(0.8, 1.2)
+            time.sleep(min(wait, max(0.0, deadline - time.monotonic())))
 
         logger.warning(f"Conversation {conversation_id} timed out after {timeout_minutes} minutes")
         return {'status': 'timeout', 'conversation_id': conversation_id}
 
 
-class OpenHandsOrchestrator:
-    """Main orchestrator for creating and managing experiment repositories for OpenHands."""
-
-    def __init__(self, config: RepoConfig, openhands_api_key: str):
-        self.config = config
-        self.github = GitHubClient(config.token, config.owner)
-        self.openhands = OpenHandsClient(openhands_api_key)
-
-    def load_ideas(self, input_path: str) -> List[ExperimentIdea]:
+class ConversationMonitor(threading.Thread):
+    """
+    Background thread that polls every watched OpenHands conversation.
+
+    Rather than each conversation getting its own polling loop, callers watch conversations
+    and block in wait(); the one dispatcher polls each conversation when its backoff delay is
+    up and wakes the waiter once it finishes.
+    """
+
+    def __init__(self, client: OpenHandsClient):
+        super().__init__(name='conversation-monitor', daemon=True)
+        self.client = client
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = False
+        # Per watched conversation: finished event, next poll time, current delay, last status
+        self._watched: Dict[str, Dict[str, Any]] = {}
+        # Final status of finished conversations, until their waiter collects it
+        self._results: Dict[str, Dict[str, Any]] = {}
+
+    def watch(self, conversation_id: str) -> threading.Event:
+        """Start polling a conversation; the returned event is set when it finishes."""
+        with self._lock:
+            watched = self._watched.get(conversation_id)
+            if watched is None:
+                watched = self._watched[conversation_id] = {
+                    'event': threading.Event(),
+                    'next_poll': 0.0,
+                    'delay': 0.0,
+                    'status': None
+                }
+        self._wakeup.set()
+        return watched['event']
+
+    def wait(self, conversation_id: str, timeout_minutes: float = 300) -> Dict[str, Any]:
         """
-        Load experiment ideas from CSV or Excel file.
-        
-        Expected columns:
-        - title: Experiment title
-        - has_experiments: Boolean (True/1 if experiments provided, False/0 if AI should plan)
-        - idea: Description of the idea
-        - experiments: Pre-defined experiments YAML (optional, used when has_experiments is True)
-        """
-        if input_path.endswith(('.xlsx', '.xls')):
-            df = pd.read_excel(input_path)
-        else:
-            df = pd.read_csv(input_path)
-
-        ideas = []
-        for _, row in df.iterrows():
-            # Parse has_experiments column (handle various boolean representations)
-            has_experiments_raw = row.get('has_experiments', False)
-            if isinstance(has_experiments_raw, str):
-                has_experiments = has_experiments_raw.lower() in ('true', '1', 'yes', 'y')
-            else:
-                has_experiments = bool(has_experiments_raw)
-            
-            idea = ExperimentIdea(
-                title=str(row.get('title', f'Idea_{len(ideas)}')),
-                idea=str(row.get('idea', '')),
-                has_experiments=has_experiments,
-                experiments=row.get('experiments') if has_experiments else None,
-                data_url=row.get('data_url'),
-                requirements=row.get('requirements')
-            )
-            ideas.append(idea)
+        Block until a conversation finishes or times out, then stop watching it.
 
-        logger.info(f"Loaded {len(ideas)} experiment ideas")
-        logger.info(f"  - {sum(1 for i in ideas if i.has_experiments)} with pre-defined experiments")
-        logger.info(f"  - {sum(1 for i in ideas if not i.has_experiments)} requiring AI planning")
-        return ideas
-
-    def create_experiment_repo(self, idea: ExperimentIdea) -> Tuple[str, str]:
-        """Create a GitHub repository for an experiment idea.
-        
-        Returns:
-            Tuple of (full_name, default_branch)
-        """
-        # Generate a clean repo name with provider suffix
-        repo_name = slugify(idea.title, max_length=70, word_boundary=True)  # Leave room for "-openhands"
-        if len(repo_name) == 0:
-            repo_name = f"experiment-{int(time.time())}"
-        
-        # Append provider name to avoid conflicts when running same experiment on multiple providers
-        repo_name = f"{repo_name}-openhands"
-
-        # Ensure uniqueness
-        base_name = repo_name
-        counter = 1
-        existing_repos = []  # In a real implementation, you might cache this
-        while f"{self.config.owner}/{repo_name}" in existing_repos:
-            repo_name = f"{base_name}-{counter}"
-            counter += 1
-
-        try:
-            # Sanitize description: remove control characters and newlines
-            raw_description = idea.idea[:140]
-            # Remove control characters and compress whitespace
-            sanitized_description = ' '.join(raw_description.split())[:140]
-            
-            repo_info = self.github.create_repo(
-                repo_name,
-                description=sanitized_description,
-                private=True
-            )
-
-            # Initialize main branch
-            default_branch = self._initialize_repo(repo_info['full_name'], repo_info['default_branch'])
-
-            return repo_info['full_name'], default_branch
-
-        except requests.HTTPError as e:
-            if e.response.status_code == 422:  # Repository might already exist or validation error
-                full_name = f"{self.config.owner}/{repo_name}"
-                
-                # Try to verify the repo actually exists (422 can mean other validation errors)
-                try:
-                    existing_repo_info = self.github.get_repo(full_name)
-                    default_branch = existing_repo_info['default_branch']
-                    logger.warning(f"Repository {full_name} already exists, using existing")
-                    logger.info(f"Existing repository default branch: {default_branch}")
-                    return full_name, default_branch
-                except requests.HTTPError as fetch_error:
-                    if fetch_error.response.status_code == 404:
-                        # Repo doesn't exist - 422 error was from something else
-                        logger.error(f"Repository creation failed with 422, but repo doesn't exist at {full_name}")
-                        logger.error(f"Original 422 error response: {e.response.text[:200]}")
-                        raise e  # Re-raise the original 422 error
-                    else:
-                        raise fetch_error
-            else:
-                raise
-
-    def _initialize_repo(self, repo_full_name: str, expected_branch: str = 'main') -> str:
-        """Initialize a repository with basic structure.
-        
         Args:
-            repo_full_name: Full repository name (owner/repo)
-            expected_branch: Expected default branch name
-            
+            conversation_id: OpenHands conversation ID
+            timeout_minutes: Maximum time to wait (default: 300 minutes = 5 hours)
+
         Returns:
-            Actual default branch name
+            Final conversation status
         """
-        # Create a basic README first to establish the main branch
-        self.github.put_file(
-            repo_full_name,
-            'README.md',
-            f'# {repo_full_name.split("/")[1]}\n\nInitializing experiment repository for OpenHands...\n',
-            'chore: initialize repository'
-        )
-        
-        # After first commit, fetch the actual default branch name
-        time.sleep(1)  # Give GitHub a moment to process
-        repo_info = self.github.get_repo(repo_full_name)
-        actual_branch = repo_info['default_branch']
-        
-        if actual_branch != expected_branch:
-            logger.info(f"Repository initialized with '{actual_branch}' branch (expected '{expected_branch}')")
-        
-        return actual_branch
+        finished = self.watch(conversation_id).wait(timeout_minutes * 60)
 
-    def seed_repository(self, repo_full_name: str, idea: ExperimentIdea):
-        """Seed the repository with experiment templates and configuration for OpenHands."""
-        logger.info(f"Seeding repository: {repo_full_name}")
-
-        # Create temporary directory for file operations
-        with tempfile.TemporaryDirectory() as temp_dir:
-            repo_dir = Path(temp_dir) / 'repo'
-
-            # Copy template files to the repository
-            self._copy_template_files(repo_full_name, idea)
+        with self._lock:
+            self._watched.pop(conversation_id, None)
+            result = self._results.pop(conversation_id, None)
 
-            # Customize experiment configuration
-            self._customize_experiments(repo_full_name, idea)
+        if finished and result is not None:
+            return result
 
-            logger.info(f"Repository {repo_full_name} seeded successfully for OpenHands")
-
-    def _copy_template_files(self, repo_full_name: str, idea: ExperimentIdea):
-        """Copy template files to the repository for OpenHands integration."""
-        template_dir = Path(__file__).parent / 'templates'
-
-        # Files to copy from templates
-        template_files = {
-            'AGENTS.md': 'AGENTS.md',
-            'microagent_repo.md': '.openhands/microagents/repo.md',
-            'experiments.yaml': 'experiments/experiments.yaml',
-            'runner.py': 'runner.py',
-            'workflow.yml': '.github/workflows/run-experiments.yml'
-        }
-
-        for template_file, repo_path in template_files.items():
-            template_path = template_dir / template_file
-            if template_path.exists():
-                with open(template_path, 'r') as f:
-                    content = f.read()
-
-                # Basic templating - replace placeholders
-                content = content.replace('{{REPO_NAME}}', repo_full_name.split('/')[1])
-                content = content.replace('{{IDEA_TITLE}}', idea.title)
-                content = content.replace('{{IDEA_DESCRIPTION}}', idea.idea or '')
-
-                self.github.put_file(
-                    repo_full_name,
-                    repo_path,
-                    content,
-                    f'add {repo_path}'
-                )
-
-        # Add additional scaffold files
-        scaffold_files = {
-            'requirements.txt': self._generate_requirements(idea),
-            'experiments/idea.json': json.dumps({
-                'title': idea.title,
-                'idea': idea.idea,
-                'has_experiments': idea.has_experiments,
-                'experiments': idea.experiments,
-                'data_url': idea.data_url,
-                'timestamp': time.time(),
-                'openhands_ready': True
-            }, indent=2),
-            'README.template.md': self._generate_readme_template(idea),
-            '.gitignore': self._generate_gitignore()
-        }
-
-        for file_path, content in scaffold_files.items():
-            self.github.put_file(
-                repo_full_name,
-                file_path,
-                content,
-                f'add {file_path}'
-            )
-
-    def _customize_experiments(self, repo_full_name: str, idea: ExperimentIdea):
-        """Customize the experiments.yaml based on the idea."""
-        if idea.has_experiments and idea.experiments:
-            # Use the provided experiments configuration
-            self.github.put_file(
-                repo_full_name,
-                'experiments/experiments.yaml',
-                idea.experiments,
-                'add pre-defined experiments configuration'
-            )
-
-    def _generate_requirements(self, idea: ExperimentIdea) -> str:
-        """Generate requirements.txt content."""
-        base_reqs = [
-            'pandas',
-            'numpy',
-            'matplotlib',
-            'seaborn',
-            'scikit-learn',
-            'jupyter',
-            'pyyaml',
-            'tqdm'
-        ]
-
-        if idea.requirements:
-            # Add idea-specific requirements
-            additional_reqs = [req.strip() for req in idea.requirements.split(',')]
-            base_reqs.extend(additional_reqs)
-
-        return '\n'.join(base_reqs) + '\n'
-
-    def _generate_readme_template(self, idea: ExperimentIdea) -> str:
-        """Generate a README template for OpenHands-managed repos."""
-        pipeline_type = "pre-defined experiments" if idea.has_experiments else "AI-planned experiments"
-        
-        return f'''# {idea.title}
-
-{idea.idea or "Experiment repository managed by OpenHands."}
-
-## Overview
-
-This repository contains a computational experiment designed to validate the idea: **{idea.title}**.
-
-**Pipeline Type:** {pipeline_type}
-
-{f"**Pre-defined Experiments:** This idea includes specific experiments to execute." if idea.has_experiments else "**AI Planning:** OpenHands will analyze the idea and generate a comprehensive experiment plan."}
-
-The experiments are {"provided in" if idea.has_experiments else "planned and defined in"} `experiments/experiments.yaml` and executed via GitHub Actions.
-OpenHands monitors the CI pipeline and automatically iterates on any failures.
-
-## OpenHands Integration
-
-This repository is configured for OpenHands Cloud monitoring:
-
-1. **Import** this repository into OpenHands Cloud
-2. **Start a conversation** with the initial experiment planning prompt
-3. **Monitor CI steps** that OpenHands will watch and iterate on
-4. **Let OpenHands** handle the iterative improvement and final README generation
-
-## Experiment Results
-
-Results and artifacts will be stored in the `artifacts/` directory after experiment execution.
-
-## Getting Started
-
-1. Import this repository into OpenHands Cloud
-2. Start a conversation with the experiment planning prompt
-3. Push changes to trigger monitored workflows
-4. OpenHands will monitor and iterate automatically
+        logger.warning(f"Conversation {conversation_id} timed out after {timeout_minutes:.0f} minutes")
+        return {'status': 'timeout', 'conversation_id': conversation_id}
 
-## Generated by OpenHands Orchestrator
+    def stop(self):
+        """Ask the dispatcher to exit; it finishes any poll in progress first."""
+        with self._lock:
+            self._stopping = True
+        self._wakeup.set()
+
+    def run(self):
+        while True:
+            now = time.monotonic()
+            with self._lock:
+                if self._stopping:
+                    return
+                due = [
+                    conversation_id for conversation_id, watched in self._watched.items()
+                    if not watched['event'].is_set() and watched['next_poll'] <= now
+                ]
+
+            for conversation_id in due:
+                self._poll(conversation_id)
+
+            # Cleared before looking for the next poll, so a watch() from here on wakes the wait
+            self._wakeup.clear()
+            with self._lock:
+                next_polls = [w['next_poll'] for w in self._watched.values() if not w['event'].is_set()]
+            timeout = max(0.0, min(next_polls) - time.monotonic()) if next_polls else None
+            self._wakeup.wait(timeout)
+
+    def _poll(self, conversation_id: str):
+        """Poll one conversation and schedule its next poll, or record its final status."""
+        try:
+            status = self.client.get_conversation_status(conversation_id)
+        except requests.RequestException as e:
+            logger.warning(f"Could not poll conversation {conversation_id}: {e}")
+            status = None
+
+        with self._lock:
+            watched = self._watched.get(conversation_id)
+            if watched is None:
+                # The waiter gave up while this poll was in flight; nobody will collect a result
+                return
+
+            if status is None:
+                delay = max(watched['delay'], self.client.suggested_poll_interval(conversation_id))
+                watched['next_poll'] = time.monotonic() + delay
+                return
 
-This repository was automatically created and configured using the OpenHands experiment orchestrator.
-Pipeline: {pipeline_type}
-OpenHands will handle the iterative improvement and final README generation.
-'''
+            conversation_status = status.get('status', '')
+            if conversation_status in FINISHED_CONVERSATION_STATUSES:
+                logger.info(f"Conversation {conversation_id} finished with status: {conversation_status}")
+                self._results[conversation_id] = status
+                watched['event'].set()
+                return
+
+            status_changed = conversation_status != watched['status']
+            if status_changed:
+                logger.debug("Conversation %s status: %s", conversation_id, conversation_status)
+                watched['status'] = conversation_status
+            watched['delay'] = self.client.next_poll_delay(conversation_id, watched['delay'], status_changed)
+            watched['next_poll'] = time.monotonic() + watched['delay'] * random.uniform(0.8, 1.2)
+
+
+# Static scaffold content shared by every seeded repository
+_BASE_REQUIREMENTS = (
+    'pandas',
+    'numpy',
+    'matplotlib',
+    'seaborn',
+    'scikit-learn',
+    'jupyter',
+    'pyyaml',
+    'tqdm'
+)
+_BASE_REQUIREMENTS_TEXT = '\n'.join(_BASE_REQUIREMENTS) + '\n'
 
-    def _generate_gitignore(self) -> str:
-        """Generate .gitignore content - SELECTIVE to commit important artifacts."""
-        return '''# Python
+_GITIGNORE = '''# Python
 __pycache__/
 *.py[cod]
 *$py.class
@@ -595,31 +857,84 @@ artifacts/**/*.model
 artifacts/**/*.bin
 artifacts/**/*.weights
 
-# KEEP these artifact files (override above patterns)
-!artifacts/**/*.json
-!artifacts/**/*.yaml
-!artifacts/**/*.yml
-!artifacts/**/*.md
-!artifacts/**/*.txt
-!artifacts/**/*.csv
-!artifacts/**/*.png
-!artifacts/**/*.jpg
-!artifacts/**/*.svg
+# KEEP these artifact files (override above patterns)
+!artifacts/**/*.json
+!artifacts/**/*.yaml
+!artifacts/**/*.yml
+!artifacts/**/*.md
+!artifacts/**/*.txt
+!artifacts/**/*.csv
+!artifacts/**/*.png
+!artifacts/**/*.jpg
+!artifacts/**/*.svg
+
+# Cache
+.cache/
+*.log
+
+# OpenHands
+.openhands/
+'''
+
+# README placeholders are filled with str.format; pipeline-specific wording is keyed by has_experiments
+_README_TEMPLATE = '''# {title}
+
+{description}
+
+## Overview
+
+This repository contains a computational experiment designed to validate the idea: **{title}**.
+
+**Pipeline Type:** {pipeline_type}
+
+{planning_note}
+
+The experiments are {experiments_source} `experiments/experiments.yaml` and executed via GitHub Actions.
+OpenHands monitors the CI pipeline and automatically iterates on any failures.
+
+## OpenHands Integration
+
+This repository is configured for OpenHands Cloud monitoring:
+
+1. **Import** this repository into OpenHands Cloud
+2. **Start a conversation** with the initial experiment planning prompt
+3. **Monitor CI steps** that OpenHands will watch and iterate on
+4. **Let OpenHands** handle the iterative improvement and final README generation
+
+## Experiment Results
 
-# Cache
-.cache/
-*.log
+Results and artifacts will be stored in the `artifacts/` directory after experiment execution.
 
-# OpenHands
-.openhands/
+## Getting Started
+
+1. Import this repository into OpenHands Cloud
+2. Start a conversation with the experiment planning prompt
+3. Push changes to trigger monitored workflows
+4. OpenHands will monitor and iterate automatically
+
+## Generated by OpenHands Orchestrator
+
+This repository was automatically created and configured using the OpenHands experiment orchestrator.
+Pipeline: {pipeline_type}
+OpenHands will handle the iterative improvement and final README generation.
 '''
 
-    def _generate_results_quality_requirements(self) -> str:
-        """
-        Generate detailed requirements for publication-quality RESULTS.md.
-        This ensures OpenHands produces comprehensive, visual, and insightful results.
-        """
-        return """
+_README_PIPELINE_TEXT = {
+    True: {
+        'pipeline_type': 'pre-defined experiments',
+        'planning_note': '**Pre-defined Experiments:** This idea includes specific experiments to execute.',
+        'experiments_source': 'provided in'
+    },
+    False: {
+        'pipeline_type': 'AI-planned experiments',
+        'planning_note': '**AI Planning:** OpenHands will analyze the idea and generate a comprehensive experiment plan.',
+        'experiments_source': 'planned and defined in'
+    }
+}
+
+
+# Guidance appended to every OpenHands prompt on what a good RESULTS.md contains
+_RESULTS_QUALITY_REQUIREMENTS = """
 ═══════════════════════════════════════════════════════════════════
 UNIVERSAL RESULTS.MD REQUIREMENTS (AUTO-ADAPT TO ANY TASK TYPE)
 ═══════════════════════════════════════════════════════════════════
@@ -818,23 +1133,9 @@ Your RESULTS.md MUST be publication-quality with:
 REMEMBER: A good RESULTS.md tells a complete story with data, visuals, and insights!
 """
 
-    def start_openhands_conversation(self, repo_full_name: str, idea: ExperimentIdea) -> str:
-        """Start an OpenHands Cloud conversation for the experiment."""
-        logger.info(f"Starting OpenHands conversation for {repo_full_name}")
-        logger.info(f"  Pipeline type: {'Pre-defined experiments' if idea.has_experiments else 'AI planning required'}")
-
-        # Get results quality requirements
-        results_requirements = self._generate_results_quality_requirements()
-
-        if idea.has_experiments:
-            # Pre-defined experiments - OpenHands should validate and implement
-            initial_prompt = f"""
-You are managing a computational experiment repository at {repo_full_name}.
-
-The experiment idea is: "{idea.title}"
-Description: {idea.idea}
-
-IMPORTANT: This idea comes with PRE-DEFINED EXPERIMENTS in experiments/experiments.yaml.
+# Instructions for ideas that come with a pre-defined experiment plan
+_PROMPT_PREDEFINED_BODY = (
+    """IMPORTANT: This idea comes with PRE-DEFINED EXPERIMENTS in experiments/experiments.yaml.
 
 ═══════════════════════════════════════════════════════════════════
 WORKFLOW - EXECUTE IN THIS ORDER:
@@ -864,19 +1165,17 @@ PHASE 4: ANALYSIS & DOCUMENTATION
 15. Update README.md with comprehensive findings
 16. Document limitations and next steps
 
-{results_requirements}
+"""
+    + _RESULTS_QUALITY_REQUIREMENTS
+    + """
 
 Start by examining the pre-defined experiment plan and implementing the required code.
 """
-        else:
-            # AI needs to plan experiments from scratch
-            initial_prompt = f"""
-You are managing a computational experiment repository at {repo_full_name}.
-
-The experiment idea is: "{idea.title}"
-Description: {idea.idea}
+)
 
-IMPORTANT: You need to DESIGN THE EXPERIMENT PLAN from scratch.
+# Instructions for ideas whose experiment plan OpenHands must design
+_PROMPT_AI_PLANNED_BODY = (
+    """IMPORTANT: You need to DESIGN THE EXPERIMENT PLAN from scratch.
 
 ═══════════════════════════════════════════════════════════════════
 WORKFLOW - EXECUTE IN THIS ORDER:
@@ -913,10 +1212,335 @@ PHASE 4: ANALYSIS & DOCUMENTATION
 17. Update README.md with comprehensive findings
 18. Document limitations and next steps
 
-{results_requirements}
+"""
+    + _RESULTS_QUALITY_REQUIREMENTS
+    + """
 
 Start by designing a comprehensive experiment plan from the ground up.
 """
+)
+
+_PROMPT_BODIES = {True: _PROMPT_PREDEFINED_BODY, False: _PROMPT_AI_PLANNED_BODY}
+
+
+class OpenHandsOrchestrator:
+    """Main orchestrator for creating and managing experiment repositories for OpenHands."""
+
+    def __init__(self, config: RepoConfig, openhands_api_key: str):
+        self.config = config
+        self.github = GitHubClient(config.token, config.owner)
+        self.openhands = OpenHandsClient(openhands_api_key)
+        self.state = StateCache(config.state_file)
+
+        # Repo names claimed during this run, so ideas with the same title don't collide
+        self._used_repo_names: set = set()
+        self._repo_names_lock = threading.Lock()
+
+    def close(self):
+        """Release the API clients' connection pools."""
+        self.github.close()
+        self.openhands.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def load_ideas(self, input_path: str) -> List[ExperimentIdea]:
+        """
+        Load experiment ideas from CSV or Excel file.
+        
+        Expected columns:
+        - title: Experiment title
+        - has_experiments: Boolean (True/1 if experiments provided, False/0 if AI should plan)
+        - idea: Description of the idea
+        - experiments: Pre-defined experiments YAML (optional, used when has_experiments is True)
+        """
+        ideas = list(self.iter_ideas(input_path))
+        with_experiments = sum(idea.has_experiments for idea in ideas)
+
+        logger.info(f"Loaded {len(ideas)} experiment ideas")
+        logger.info(f"  - {with_experiments} with pre-defined experiments")
+        logger.info(f"  - {len(ideas) - with_experiments} requiring AI planning")
+        return ideas
+
+    def iter_ideas(self, input_path: str) -> Iterator[ExperimentIdea]:
+        """
+        Lazily yield experiment ideas from a CSV or Excel file.
+
+        CSV files are read row by row with the csv module and .xlsx files with openpyxl in
+        read-only mode, so large idea files never need to be held in memory at once. Legacy
+        .xls files are read whole with pandas, then yielded the same way.
+
+        Args:
+            input_path: Path to the CSV/Excel file (same columns as load_ideas)
+
+        Yields:
+            ExperimentIdea for each row, in file order
+        """
+        if input_path.endswith('.xls'):
+            import pandas as pd
+            yield from self._ideas_from_frame(pd.read_excel(input_path))
+            return
+
+        rows = _iter_xlsx_rows(input_path) if input_path.endswith('.xlsx') else _iter_csv_rows(input_path)
+        for index, row in enumerate(rows):
+            # Empty and NA-like cells become None, as they do when read through pandas
+            values = {column: row.get(column) for column in IDEA_COLUMNS}
+            values = {
+                column: None if isinstance(value, str) and value in _MISSING_CELL_VALUES else value
+                for column, value in values.items()
+            }
+            title = str(values['title']) if values['title'] is not None else f'Idea_{index}'
+            has_experiments = _parse_has_experiments(values['has_experiments'])
+            yield ExperimentIdea(
+                title=title,
+                idea=str(values['idea']) if values['idea'] is not None else '',
+                has_experiments=has_experiments,
+                experiments=values['experiments'] if has_experiments else None,
+                data_url=values['data_url'],
+                requirements=values['requirements'],
+                slug=_slugify_title(title, index)
+            )
+
+    def _ideas_from_frame(self, df: 'pd.DataFrame') -> List[ExperimentIdea]:
+        """Convert a DataFrame of idea rows into ExperimentIdea objects."""
+        import pandas as pd
+
+        # Normalize whole columns at once; missing optional columns become empty
+        df = df.reindex(columns=IDEA_COLUMNS)
+        default_titles = pd.Series([f'Idea_{i}' for i in range(len(df))], index=df.index)
+        df['title'] = df['title'].fillna(default_titles).astype(str)
+        df['idea'] = df['idea'].fillna('').astype(str)
+        df['has_experiments'] = df['has_experiments'].map(_parse_has_experiments)
+
+        # Empty cells become None rather than NaN (NaN is truthy and not valid JSON)
+        df = df.astype(object).where(df.notna(), None)
+
+        return [
+            ExperimentIdea(
+                title=title,
+                idea=idea,
+                has_experiments=has_experiments,
+                experiments=experiments if has_experiments else None,
+                data_url=data_url,
+                requirements=requirements,
+                slug=_slugify_title(title, index)
+            )
+            for index, (title, idea, has_experiments, experiments, data_url, requirements)
+            in enumerate(df.itertuples(index=False, name=None))
+        ]
+
+    def create_experiment_repo(self, idea: ExperimentIdea) -> Tuple[str, str]:
+        """Create a GitHub repository for an experiment idea.
+        
+        Returns:
+            Tuple of (full_name, default_branch)
+        """
+        # Generate a clean repo name with provider suffix
+        if idea.slug is None:
+            idea.slug = _slugify_title(idea.title)
+        
+        # Append provider name to avoid conflicts when running same experiment on multiple providers
+        repo_name = f"{idea.slug}-openhands"
+
+        # Ensure uniqueness within this run
+        with self._repo_names_lock:
+            base_name = repo_name
+            counter = 1
+            while repo_name in self._used_repo_names:
+                repo_name = f"{base_name}-{counter}"
+                counter += 1
+            self._used_repo_names.add(repo_name)
+
+        try:
+            # Sanitize description: remove control characters and newlines
+            raw_description = idea.idea[:140]
+            # Remove control characters and compress whitespace
+            sanitized_description = ' '.join(raw_description.split())[:140]
+            
+            repo_info = self.github.create_repo(
+                repo_name,
+                description=sanitized_description,
+                private=True
+            )
+
+            # Initialize main branch
+            default_branch = self._initialize_repo(repo_info['full_name'], repo_info['default_branch'])
+
+            return repo_info['full_name'], default_branch
+
+        except requests.HTTPError as e:
+            if e.response.status_code == 422:  # Repository might already exist or validation error
+                full_name = f"{self.config.owner}/{repo_name}"
+                
+                # Try to verify the repo actually exists (422 can mean other validation errors)
+                try:
+                    existing_repo_info = self.github.get_repo(full_name)
+                    default_branch = existing_repo_info['default_branch']
+                    logger.warning(f"Repository {full_name} already exists, using existing")
+                    logger.info(f"Existing repository default branch: {default_branch}")
+                except requests.HTTPError as fetch_error:
+                    if fetch_error.response.status_code == 404:
+                        # Repo doesn't exist - 422 error was from something else
+                        logger.error(f"Repository creation failed with 422, but repo doesn't exist at {full_name}")
+                        logger.error(f"Original 422 error response: {e.response.text[:200]}")
+                        raise e  # Re-raise the original 422 error
+                    else:
+                        raise fetch_error
+
+                # A run that stopped between creating the repo and its first commit leaves it
+                # empty, and seeding needs an existing branch to commit onto
+                if not self._branch_exists(full_name, default_branch):
+                    logger.info(f"Existing repository {full_name} is empty, initializing it")
+                    default_branch = self._initialize_repo(full_name, default_branch)
+                return full_name, default_branch
+            else:
+                raise
+
+    def _branch_exists(self, repo_full_name: str, branch: str) -> bool:
+        """Check whether a branch exists (it doesn't in a repository with no commits)."""
+        try:
+            self.github.get_branch(repo_full_name, branch)
+            return True
+        except requests.HTTPError as e:
+            if e.response.status_code == 404:
+                return False
+            raise
+
+    def _initialize_repo(self, repo_full_name: str, expected_branch: str = 'main') -> str:
+        """Initialize a repository with basic structure.
+        
+        Args:
+            repo_full_name: Full repository name (owner/repo)
+            expected_branch: Expected default branch name
+            
+        Returns:
+            Actual default branch name
+        """
+        readme = f'# {repo_full_name.split("/")[1]}\n\nInitializing experiment repository for OpenHands...\n'
+
+        # Create a basic README first to establish the main branch. The first commit lands on
+        # the default branch reported by create_repo, so no follow-up lookup is needed unless
+        # GitHub hasn't finished provisioning the repository yet.
+        max_attempts = 4
+        for attempt in range(max_attempts):
+            try:
+                self.github.put_file(repo_full_name, 'README.md', readme, 'chore: initialize repository')
+                break
+            except requests.HTTPError as e:
+                if e.response.status_code != 404 or attempt == max_attempts - 1:
+                    raise
+                wait_time = 2 ** attempt
+                logger.warning(f"Repository {repo_full_name} not ready yet, retrying in {wait_time}s...")
+                time.sleep(wait_time)
+                expected_branch = self.github.get_repo(repo_full_name, refresh=True)['default_branch']
+
+        return expected_branch
+
+    def seed_repository(self, repo_full_name: str, idea: ExperimentIdea, branch: str):
+        """Seed the repository with experiment templates and configuration for OpenHands."""
+        logger.info(f"Seeding repository: {repo_full_name}")
+
+        # Collect template files for the repository
+        files = self._copy_template_files(repo_full_name, idea)
+
+        # Push everything as a single commit
+        self.github.commit_files(
+            repo_full_name,
+            branch,
+            files,
+            'chore: seed experiment scaffold'
+        )
+
+        logger.info(f"Repository {repo_full_name} seeded successfully for OpenHands")
+
+    def _copy_template_files(self, repo_full_name: str, idea: ExperimentIdea) -> Dict[str, str]:
+        """Build the template files for OpenHands integration, keyed by repository path."""
+        template_dir = Path(__file__).parent / 'templates'
+
+        # Files to copy from templates
+        template_files = {
+            'AGENTS.md': 'AGENTS.md',
+            'microagent_repo.md': '.openhands/microagents/repo.md',
+            'experiments.yaml': 'experiments/experiments.yaml',
+            'runner.py': 'runner.py',
+            'workflow.yml': '.github/workflows/run-experiments.yml'
+        }
+
+        placeholders = {
+            'REPO_NAME': repo_full_name.split('/')[1],
+            'IDEA_TITLE': idea.title,
+            'IDEA_DESCRIPTION': idea.idea or ''
+        }
+
+        # Ideas that come with their own experiments replace the template instead of overwriting it
+        custom_experiments = idea.experiments if (idea.has_experiments and idea.experiments) else None
+
+        files = {}
+        for template_file, repo_path in template_files.items():
+            if template_file == 'experiments.yaml' and custom_experiments:
+                files[repo_path] = custom_experiments
+                continue
+
+            content = _load_template(template_dir / template_file)
+            if content is not None:
+                # Basic templating - replace placeholders
+                files[repo_path] = _PLACEHOLDER_RE.sub(lambda m: placeholders[m.group(1)], content)
+
+        # Add additional scaffold files
+        scaffold_files = {
+            'requirements.txt': self._generate_requirements(idea),
+            'experiments/idea.json': _dumps_json({
+                'title': idea.title,
+                'idea': idea.idea,
+                'has_experiments': idea.has_experiments,
+                'experiments': idea.experiments,
+                'data_url': idea.data_url,
+                'timestamp': time.time(),
+                'openhands_ready': True
+            }),
+            'README.template.md': self._generate_readme_template(idea),
+            '.gitignore': self._generate_gitignore()
+        }
+
+        files.update(scaffold_files)
+        return files
+
+    def _generate_requirements(self, idea: ExperimentIdea) -> str:
+        """Generate requirements.txt content."""
+        if not idea.requirements:
+            return _BASE_REQUIREMENTS_TEXT
+
+        # Add idea-specific requirements
+        additional_reqs = [req.strip() for req in idea.requirements.split(',') if req.strip()]
+        return '\n'.join(_BASE_REQUIREMENTS + tuple(additional_reqs)) + '\n'
+
+    def _generate_readme_template(self, idea: ExperimentIdea) -> str:
+        """Generate a README template for OpenHands-managed repos."""
+        return _README_TEMPLATE.format(
+            title=idea.title,
+            description=idea.idea or "Experiment repository managed by OpenHands.",
+            **_README_PIPELINE_TEXT[bool(idea.has_experiments)]
+        )
+
+    def _generate_gitignore(self) -> str:
+        """Generate .gitignore content - SELECTIVE to commit important artifacts."""
+        return _GITIGNORE
+
+    def start_openhands_conversation(self, repo_full_name: str, idea: ExperimentIdea) -> str:
+        """Start an OpenHands Cloud conversation for the experiment."""
+        logger.info(f"Starting OpenHands conversation for {repo_full_name}")
+        logger.info(f"  Pipeline type: {'Pre-defined experiments' if idea.has_experiments else 'AI planning required'}")
+
+        initial_prompt = f"""
+You are managing a computational experiment repository at {repo_full_name}.
+
+The experiment idea is: "{idea.title}"
+Description: {idea.idea}
+
+""" + _PROMPT_BODIES[bool(idea.has_experiments)]
 
         conversation_id = self.openhands.start_conversation(repo_full_name, initial_prompt)
         return conversation_id
@@ -934,33 +1558,67 @@ Start by designing a comprehensive experiment plan from the ground up.
 
         return final_status
 
+    def monitor_conversations(self, conversation_ids: List[str],
+                              timeout_minutes: int = 300) -> Dict[str, Dict[str, Any]]:
+        """
+        Wait for several conversations at once, polling all of them from one dispatcher thread.
+
+        Args:
+            conversation_ids: OpenHands conversation IDs
+            timeout_minutes: Maximum time to wait for all of them (default: 300 minutes = 5 hours)
+
+        Returns:
+            Final status of each conversation, keyed by conversation ID
+        """
+        logger.info(f"Monitoring {len(conversation_ids)} OpenHands conversations")
+        monitor = ConversationMonitor(self.openhands)
+        for conversation_id in conversation_ids:
+            monitor.watch(conversation_id)
+        monitor.start()
+
+        deadline = time.monotonic() + timeout_minutes * 60
+        try:
+            return {
+                conversation_id: monitor.wait(conversation_id, max(0.0, deadline - time.monotonic()) / 60)
+                for conversation_id in conversation_ids
+            }
+        finally:
+            monitor.stop()
+
     def process_idea(self, idea: ExperimentIdea) -> Dict[str, Any]:
         """Process a single experiment idea from start to finish."""
         logger.info(f"Processing idea: {idea.title}")
+        state_key = StateCache.key_for(idea)
+        progress = self.state.get(state_key)
+
+        if progress.get('conversation_id'):
+            logger.info(f"Conversation already started for {progress['repo']}, skipping")
+            return self._conversation_started_result(idea, progress['repo'], progress['conversation_id'])
 
         try:
             # 1. Create repository
-            repo_full_name, default_branch = self.create_experiment_repo(idea)
+            if progress.get('repo'):
+                repo_full_name, default_branch = progress['repo'], progress['default_branch']
+                logger.info(f"Reusing repository from previous run: {repo_full_name}")
+            else:
+                repo_full_name, default_branch = self.create_experiment_repo(idea)
+                self.state.update(state_key, repo=repo_full_name, default_branch=default_branch)
             logger.info(f"Repository default branch: {default_branch}")
 
             # 2. Seed with templates for OpenHands
-            self.seed_repository(repo_full_name, idea)
+            if not progress.get('seeded'):
+                self.seed_repository(repo_full_name, idea, default_branch)
+                self.state.update(state_key, seeded=True)
 
             # 3. Start OpenHands conversation
             conversation_id = self.start_openhands_conversation(repo_full_name, idea)
+            self.state.update(state_key, conversation_id=conversation_id)
 
             # 4. Monitor conversation (optional - can run asynchronously)
             # In production, you might want to monitor or just return the conversation ID
             # conversation_status = self.monitor_conversation(conversation_id)
 
-            return {
-                'idea': idea.title,
-                'repo': repo_full_name,
-                'status': 'conversation_started',
-                'conversation_id': conversation_id,
-                'openhands_ready': True,
-                'instructions': f'OpenHands conversation started. Monitor at: https://app.all-hands.dev/conversations/{conversation_id}'
-            }
+            return self._conversation_started_result(idea, repo_full_name, conversation_id)
 
         except Exception as e:
             logger.error(f"Error processing idea {idea.title}: {e}")
@@ -970,13 +1628,37 @@ Start by designing a comprehensive experiment plan from the ground up.
                 'error': str(e)
             }
 
-    def run_batch(self, ideas: List[ExperimentIdea]) -> List[Dict[str, Any]]:
-        """Process multiple ideas with concurrency control."""
-        results = []
+    def _conversation_started_result(self, idea: ExperimentIdea, repo_full_name: str,
+                                     conversation_id: str) -> Dict[str, Any]:
+        """Build the process_idea result for an idea whose OpenHands conversation is running."""
+        return {
+            'idea': idea.title,
+            'repo': repo_full_name,
+            'status': 'conversation_started',
+            'conversation_id': conversation_id,
+            'openhands_ready': True,
+            'instructions': f'OpenHands conversation started. Monitor at: https://app.all-hands.dev/conversations/{conversation_id}'
+        }
 
-        for idea in ideas:
-            result = self.process_idea(idea)
-            results.append(result)
+    def run_batch(self, ideas: Iterable[ExperimentIdea]) -> List[Dict[str, Any]]:
+        """Process multiple ideas (a list or a lazy iterator) with concurrency control."""
+        # Look up the owner's account type once up front, so workers don't race to fetch it
+        try:
+            self.github._is_user_account()
+        except requests.RequestException as e:
+            logger.warning(f"Could not determine account type of {self.config.owner}: {e}")
+
+        # Ideas spend nearly all their time waiting on GitHub/OpenHands, so threads suffice
+        logger.info(f"Processing ideas with up to {self.config.max_concurrent} concurrent workers")
+        results = []
+        in_flight = deque()
+        with ThreadPoolExecutor(max_workers=self.config.max_concurrent) as executor:
+            # Only read ahead a little, so a large idea file is never fully materialized
+            for idea in ideas:
+                if len(in_flight) >= self.config.max_concurrent * 2:
+                    results.append(in_flight.popleft().result())
+                in_flight.append(executor.submit(self.process_idea, idea))
+            results.extend(future.result() for future in in_flight)
 
         return results
 
@@ -1000,12 +1682,22 @@ def main():
         action='store_true',
         help='Show what would be done without executing'
     )
+    parser.add_argument(
+        '--state-file',
+        default=None,
+        help='JSON file tracking progress so reruns skip completed work (off by default)'
+    )
     parser.add_argument(
         '--monitor-timeout',
         type=int,
         default=300,
         help='Timeout in minutes for monitoring conversations (default: 300 = 5 hours)'
     )
+    parser.add_argument(
+        '--monitor',
+        action='store_true',
+        help='Wait for the started conversations to finish (bounded by --monitor-timeout)'
+    )
 
     args = parser.parse_args()
 
@@ -1025,7 +1717,8 @@ def main():
     config = RepoConfig(
         owner=github_owner,
         token=github_token,
-        max_concurrent=args.max_concurrent
+        max_concurrent=args.max_concurrent,
+        state_file=args.state_file or None
     )
 
     # Initialize orchestrator
@@ -1033,19 +1726,18 @@ def main():
 
     if args.dry_run:
         logger.info("DRY RUN MODE - No actual changes will be made")
+        orchestrator.close()
         return
 
     try:
-        # Load ideas
-        ideas = orchestrator.load_ideas(args.input)
-
-        # Process ideas
-        logger.info(f"Starting batch processing of {len(ideas)} ideas for OpenHands")
-        results = orchestrator.run_batch(ideas)
+        # Process ideas as they are read from the input file
+        logger.info(f"Starting batch processing of ideas from {args.input} for OpenHands")
+        results = orchestrator.run_batch(orchestrator.iter_ideas(args.input))
 
         # Summarize results
-        successful = [r for r in results if r.get('status') == 'conversation_started']
-        failed = [r for r in results if r.get('status') != 'conversation_started']
+        successful, failed = [], []
+        for result in results:
+            (successful if result.get('status') == 'conversation_started' else failed).append(result)
 
         logger.info(f"Batch processing completed:")
         logger.info(f"  OpenHands conversations started: {len(successful)}")
@@ -1054,12 +1746,22 @@ def main():
         if successful:
             logger.info("Started conversations:")
             for result in successful:
-                logger.info(f"  - {result['repo']}: {result.get('conversation_id', 'N/A')}")
+                logger.info("  - %s: %s", result['repo'], result.get('conversation_id', 'N/A'))
 
         if failed:
             logger.warning("Failed repositories:")
             for result in failed:
-                logger.warning(f"  - {result['idea']}: {result.get('error', 'Unknown error')}")
+                logger.warning("  - %s: %s", result['idea'], result.get('error', 'Unknown error'))
+
+        if args.monitor and successful:
+            final_statuses = orchestrator.monitor_conversations(
+                [result['conversation_id'] for result in successful],
+                timeout_minutes=args.monitor_timeout
+            )
+            logger.info("Conversation outcomes:")
+            for result in successful:
+                status = final_statuses[result['conversation_id']].get('status', 'unknown')
+                logger.info("  - %s: %s", result['repo'], status)
 
         logger.info("\nNext steps:")
         logger.info("1. Monitor OpenHands conversations at https://app.all-hands.dev")
@@ -1069,6 +1771,8 @@ def main():
     except Exception as e:
         logger.error(f"Orchestration failed: {e}")
         sys.exit(1)
+    finally:
+        orchestrator.close()
 
 
 if __name__ == '__main__':
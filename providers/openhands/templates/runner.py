@@ -11,15 +11,34 @@ Usage:
 
 import argparse
 import json
+import operator
 import os
+import random
+import signal
 import subprocess
 import sys
 import time
 import yaml
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Callable, Dict, Any, List, Optional, Tuple
 import logging
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+try:
+    import orjson  # Optional: faster JSON serialization for results
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # Optional: streams only the needed keys out of large result files
+except ImportError:
+    ijson = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -31,6 +50,83 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Comparison operators supported by json_value sanity checks
+CHECK_OPERATORS = {
+    '>=': operator.ge,
+    '>': operator.gt,
+    '<=': operator.le,
+    '<': operator.lt,
+    '==': operator.eq,
+    '!=': operator.ne
+}
+
+# JSON files at least this large are stream-parsed for just the checked keys (when ijson is installed)
+STREAM_JSON_MIN_BYTES = 8 * 1024 * 1024
+
+# Bytes from the end of a command's output returned as its preview; the full output is in its log file
+OUTPUT_TAIL_BYTES = 4096
+
+# Retry backoff: base delay doubled per attempt, capped, plus up to RETRY_JITTER_SECONDS of jitter
+RETRY_BASE_DELAY_SECONDS = 10
+RETRY_MAX_DELAY_SECONDS = 60
+RETRY_JITTER_SECONDS = 2
+
+
+def dump_json(data: Any, indent: bool = True) -> bytes:
+    """Serialize data to JSON bytes, using orjson when installed (non-JSON values become strings)."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option, default=str)
+    return json.dumps(data, indent=2 if indent else None, default=str).encode('utf-8')
+
+
+def run_command_to_log(args, log_handle, timeout_seconds: float, **popen_kwargs) -> Tuple[int, str]:
+    """
+    Run a command with its combined stdout/stderr written straight to a log file.
+
+    The child process writes to the file descriptor directly, so output never passes
+    through Python; only a short tail is read back afterwards as a preview.
+
+    Args:
+        args: Command to run (list, or string when shell=True is passed)
+        log_handle: Log file opened in binary read/write mode, positioned where output should start
+        timeout_seconds: Wall-clock limit after which the command is killed
+        **popen_kwargs: Extra arguments for subprocess.Popen (cwd, env, shell, ...)
+
+    Returns:
+        Tuple of (exit_code: int, output_tail: str)
+
+    Raises:
+        subprocess.TimeoutExpired: If the command exceeded timeout_seconds
+    """
+    log_handle.flush()
+    output_start = log_handle.tell()
+
+    # Run in its own process group so a timeout also kills any children it spawned
+    process = subprocess.Popen(
+        args,
+        stdout=log_handle,
+        stderr=subprocess.STDOUT,
+        start_new_session=hasattr(os, 'killpg'),
+        **popen_kwargs
+    )
+    try:
+        exit_code = process.wait(timeout=timeout_seconds)
+    except subprocess.TimeoutExpired:
+        if hasattr(os, 'killpg'):
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+        process.wait()
+        raise
+
+    # Read back only the end of what the command wrote
+    output_end = os.fstat(log_handle.fileno()).st_size
+    log_handle.seek(max(output_start, output_end - OUTPUT_TAIL_BYTES))
+    tail = log_handle.read(output_end - log_handle.tell())
+
+    return exit_code, tail.decode('utf-8', errors='replace')
+
 
 class ExperimentRunner:
     """Handles execution of experiment steps with sanity checking and retries."""
@@ -45,11 +141,36 @@ class ExperimentRunner:
         """
         self.config_path = Path(config_path)
         self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        # Create output subdirectories once rather than on every write
+        self.logs_dir = self.output_dir / "logs"
+        self.step_results_dir = self.output_dir / "step_results"
+        for directory in (self.logs_dir, self.step_results_dir):
+            directory.mkdir(parents=True, exist_ok=True)
+
+        # Working directory and environment shared by every step command
+        self._cwd = Path.cwd()
+        self._base_env = {**os.environ, 'PYTHONPATH': str(self._cwd)}
 
         # Load experiment configuration
         with open(self.config_path, 'r') as f:
-            self.config = yaml.safe_load(f)
+            self.config = yaml.load(f, Loader=YamlLoader)
+
+        # Index steps by name once so lookups don't rescan the config
+        self._steps_by_name = {s['name']: s for s in self.config.get('steps', [])}
+        self._post_process = self.config.get('post_process', [])
+
+        # Precompile json_value comparisons once instead of re-parsing them on every attempt.
+        # Keyed by id() since the check dicts live as long as the config.
+        self._compiled_checks: Dict[int, Callable[[Any], Tuple[bool, str]]] = {}
+        for step in self.config.get('steps', []):
+            for check in step.get('sanity', []):
+                if check.get('type') == 'json_value':
+                    try:
+                        self._compiled_checks[id(check)] = self._compile_check(check)
+                    except (KeyError, TypeError, ValueError):
+                        # Malformed check - reported when it runs
+                        pass
 
         logger.info(f"Loaded experiment config from {config_path}")
 
@@ -63,10 +184,10 @@ class ExperimentRunner:
         Returns:
             Tuple of (success: bool, results: dict)
         """
-        if step_name not in [s['name'] for s in self.config.get('steps', [])]:
+        step_config = self._steps_by_name.get(step_name)
+        if step_config is None:
             raise ValueError(f"Step '{step_name}' not found in experiment config")
 
-        step_config = next(s for s in self.config['steps'] if s['name'] == step_name)
         logger.info(f"Executing step: {step_name}")
         logger.info(f"Description: {step_config.get('description', 'No description')}")
 
@@ -80,14 +201,30 @@ class ExperimentRunner:
             try:
                 success, output, exit_code = self._execute_command(
                     step_config['cmd'],
+                    step_name,
+                    attempt + 1,
                     timeout_minutes=timeout_minutes
                 )
 
-                # Run sanity checks
-                sanity_passed, sanity_results = self._run_sanity_checks(
-                    step_config.get('sanity', []),
-                    step_name
-                )
+                # Run sanity checks; a failed command didn't produce anything worth checking
+                if success:
+                    sanity_passed, sanity_results = self._run_sanity_checks(
+                        step_config.get('sanity', []),
+                        step_name
+                    )
+                else:
+                    sanity_passed = False
+                    sanity_results = [
+                        {
+                            'type': check.get('type', ''),
+                            'config': check,
+                            'passed': False,
+                            'skipped': True,
+                            'message': 'Skipped: command failed',
+                            'timestamp': time.time()
+                        }
+                        for check in step_config.get('sanity', [])
+                    ]
 
                 # Log results
                 result = {
@@ -110,8 +247,10 @@ class ExperimentRunner:
                 else:
                     logger.warning(f"Step {step_name} failed sanity checks or execution")
                     if attempt < max_retries:
-                        logger.info("Retrying after backoff...")
-                        time.sleep(10 * (attempt + 1))  # Exponential backoff
+                        delay = min(RETRY_MAX_DELAY_SECONDS, RETRY_BASE_DELAY_SECONDS * (1 << attempt))
+                        delay += random.uniform(0, RETRY_JITTER_SECONDS)
+                        logger.info(f"Retrying after {delay:.1f}s backoff...")
+                        time.sleep(delay)
 
             except Exception as e:
                 logger.error(f"Error executing step {step_name}: {e}")
@@ -128,12 +267,15 @@ class ExperimentRunner:
         logger.error(f"Step {step_name} failed after {max_retries + 1} attempts")
         return False, result
 
-    def _execute_command(self, cmd: str, timeout_minutes: int = 60) -> Tuple[bool, str, int]:
+    def _execute_command(self, cmd: str, step_name: str, attempt: int,
+                         timeout_minutes: int = 60) -> Tuple[bool, str, int]:
         """
         Execute a shell command with timeout.
 
         Args:
             cmd: Command to execute
+            step_name: Name of the step the command belongs to
+            attempt: Attempt number, used to keep retry logs apart
             timeout_minutes: Timeout in minutes
 
         Returns:
@@ -141,37 +283,27 @@ class ExperimentRunner:
         """
         logger.info(f"Running command: {cmd}")
 
+        # One log per attempt; the nanosecond suffix keeps fast reruns from overwriting each other
+        log_file = self.logs_dir / f"{step_name}-a{attempt}-{time.monotonic_ns()}.log"
+
         try:
-            # Set environment variables for the command
-            env = os.environ.copy()
-            env['PYTHONPATH'] = str(Path.cwd())
-
-            result = subprocess.run(
-                cmd,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=timeout_minutes * 60,
-                cwd=Path.cwd(),
-                env=env
-            )
-
-            success = result.returncode == 0
-            output = result.stdout + result.stderr
-
-            logger.info(f"Command completed with exit code {result.returncode}")
-
-            # Save command output to log file
-            log_file = self.output_dir / "logs" / f"step_{cmd.split()[0]}_{int(time.time())}.log"
-            log_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(log_file, 'w') as f:
-                f.write(f"Command: {cmd}\n")
-                f.write(f"Exit code: {result.returncode}\n")
-                f.write("Output:\n")
-                f.write(output)
-                f.write("\n")
-
-            return success, output, result.returncode
+            # Command output goes straight to its log file
+            with open(log_file, 'w+b') as f:
+                f.write(f"Command: {cmd}\nOutput:\n".encode('utf-8'))
+                exit_code, output = run_command_to_log(
+                    cmd,
+                    f,
+                    timeout_seconds=timeout_minutes * 60,
+                    shell=True,
+                    cwd=self._cwd,
+                    env=self._base_env
+                )
+                f.write(f"\nExit code: {exit_code}\n".encode('utf-8'))
+
+            success = exit_code == 0
+            logger.info(f"Command completed with exit code {exit_code} (output in {log_file})")
+
+            return success, output, exit_code
 
         except subprocess.TimeoutExpired:
             logger.error(f"Command timed out after {timeout_minutes} minutes")
@@ -188,32 +320,120 @@ class ExperimentRunner:
         Returns:
             Tuple of (all_passed: bool, results: list of check results)
         """
-        results = []
-
-        for check in sanity_checks:
-            check_result = self._run_single_sanity_check(check)
-            results.append(check_result)
+        # Several checks often read the same metrics file; parse each one only once
+        json_cache = self._load_json_files(sanity_checks)
+        results = [self._run_single_sanity_check(check, json_cache=json_cache) for check in sanity_checks]
 
         all_passed = all(r['passed'] for r in results)
 
         # Save sanity results
         sanity_file = self.output_dir / f"sanity_{step_name}.json"
-        with open(sanity_file, 'w') as f:
-            json.dump({
-                'step': step_name,
-                'checks': results,
-                'all_passed': all_passed,
-                'timestamp': time.time()
-            }, f, indent=2)
+        sanity_file.write_bytes(dump_json({
+            'step': step_name,
+            'checks': results,
+            'all_passed': all_passed,
+            'timestamp': time.time()
+        }))
 
         return all_passed, results
 
-    def _run_single_sanity_check(self, check: Dict) -> Dict:
+    @staticmethod
+    def _compile_check(check: Dict) -> Callable[[Any], Tuple[bool, str]]:
+        """
+        Build the comparison for a json_value check.
+
+        Numeric strings in the expected value are converted once here; actual values are
+        converted to the same type when compared.
+
+        Args:
+            check: json_value sanity check configuration
+
+        Returns:
+            Function taking the actual value and returning (passed, message)
+        """
+        key = check['key']
+        symbol = check['operator']
+        expected_value = check['value']
+        compare = CHECK_OPERATORS.get(symbol)
+
+        # Type conversion for comparison
+        convert = None
+        if isinstance(expected_value, str) and expected_value.replace('.', '').isdigit():
+            convert = float if '.' in expected_value else int
+            expected_value = convert(expected_value)
+
+        def evaluate(actual_value: Any) -> Tuple[bool, str]:
+            if convert is not None and isinstance(actual_value, (int, float, str)):
+                actual_value = convert(actual_value)
+            passed = compare(actual_value, expected_value) if compare else False
+            return passed, f"{key} = {actual_value} {symbol} {expected_value}: {passed}"
+
+        return evaluate
+
+    def _load_json_files(self, sanity_checks: List[Dict]) -> Dict[str, Any]:
+        """
+        Read every JSON file referenced by json_value checks, once per distinct path.
+
+        Files that are missing or unreadable are left out, so the individual check
+        reports the problem exactly as it would without the cache.
+
+        Args:
+            sanity_checks: List of sanity check configurations
+
+        Returns:
+            Mapping of path to parsed JSON data
+        """
+        cache = {}
+        keys_by_path: Dict[str, set] = {}
+        for check in sanity_checks:
+            if check.get('type') == 'json_value' and 'path' in check:
+                keys_by_path.setdefault(check['path'], set()).add(check.get('key'))
+
+        for path, keys in keys_by_path.items():
+            try:
+                if ijson is not None and os.path.getsize(path) >= STREAM_JSON_MIN_BYTES:
+                    cache[path] = self._stream_json_keys(path, keys)
+                else:
+                    with open(path, 'r') as f:
+                        cache[path] = json.load(f)
+            except (OSError, ValueError):
+                continue
+        return cache
+
+    @staticmethod
+    def _stream_json_keys(path: str, keys: set) -> Dict[str, Any]:
+        """
+        Pull selected top-level keys out of a large JSON object without loading all of it.
+
+        Parsing stops as soon as every requested key has been seen, so keys missing from
+        the result really are absent from the file.
+
+        Args:
+            path: Path to a JSON file whose top level is an object
+            keys: Top-level keys the checks need
+
+        Returns:
+            Mapping of the requested keys that were found to their values
+        """
+        found = {}
+        with open(path, 'rb') as f:
+            try:
+                for key, value in ijson.kvitems(f, '', use_float=True):
+                    if key in keys:
+                        found[key] = value
+                        if len(found) == len(keys):
+                            break
+            except ijson.JSONError as e:
+                raise ValueError(f"Invalid JSON in {path}: {e}") from e
+        return found
+
+    def _run_single_sanity_check(self, check: Dict, json_cache: Optional[Dict[str, Any]] = None) -> Dict:
         """
         Run a single sanity check.
 
         Args:
             check: Sanity check configuration
+            json_cache: Already-parsed JSON files keyed by path (from _load_json_files)
 
         Returns:
             Check result dictionary
@@ -232,45 +452,20 @@ class ExperimentRunner:
                     passed = False
                     message = f"JSON file {path} does not exist"
                 else:
-                    with open(path, 'r') as f:
-                        data = json.load(f)
+                    if json_cache is not None and check['path'] in json_cache:
+                        data = json_cache[check['path']]
+                    else:
+                        with open(path, 'r') as f:
+                            data = json.load(f)
 
                     key = check['key']
-                    operator = check['operator']
-                    expected_value = check['value']
+                    evaluate = self._compiled_checks.get(id(check)) or self._compile_check(check)
 
                     if key not in data:
                         passed = False
                         message = f"Key '{key}' not found in {path}"
                     else:
-                        actual_value = data[key]
-
-                        # Type conversion for comparison
-                        if isinstance(expected_value, str) and expected_value.replace('.', '').isdigit():
-                            if '.' in expected_value:
-                                expected_value = float(expected_value)
-                                actual_value = float(actual_value) if isinstance(actual_value, (int, float, str)) else actual_value
-                            else:
-                                expected_value = int(expected_value)
-                                actual_value = int(actual_value) if isinstance(actual_value, (int, float, str)) else actual_value
-
-                        # Perform comparison
-                        if operator == '>=':
-                            passed = actual_value >= expected_value
-                        elif operator == '>':
-                            passed = actual_value > expected_value
-                        elif operator == '<=':
-                            passed = actual_value <= expected_value
-                        elif operator == '<':
-                            passed = actual_value < expected_value
-                        elif operator == '==':
-                            passed = actual_value == expected_value
-                        elif operator == '!=':
-                            passed = actual_value != expected_value
-                        else:
-                            passed = False
-
-                        message = f"{key} = {actual_value} {operator} {expected_value}: {passed}"
+                        passed, message = evaluate(data[key])
 
             else:
                 passed = False
@@ -289,13 +484,10 @@ class ExperimentRunner:
         }
 
     def _save_step_results(self, step_name: str, attempt: int, result: Dict):
-        """Save step execution results to artifacts directory."""
-        results_dir = self.output_dir / "step_results"
-        results_dir.mkdir(parents=True, exist_ok=True)
-
-        result_file = results_dir / f"{step_name}_attempt_{attempt + 1}.json"
-        with open(result_file, 'w') as f:
-            json.dump(result, f, indent=2, default=str)
+        """Append a step attempt's results to the step's NDJSON file (one JSON record per line)."""
+        result_file = self.step_results_dir / f"{step_name}.ndjson"
+        with open(result_file, 'ab') as f:
+            f.write(dump_json(result, indent=False) + b'\n')
 
     def run_all_steps(self) -> Dict[str, Any]:
         """
@@ -305,6 +497,7 @@ class ExperimentRunner:
             Summary of all step results
         """
         results = {}
+        all_ok = True
         stop_on_fail = self.config.get('stop_on_fail', True)
 
         for step in self.config.get('steps', []):
@@ -313,13 +506,14 @@ class ExperimentRunner:
 
             success, step_result = self.run_step(step_name)
             results[step_name] = step_result
+            all_ok = all_ok and bool(step_result.get('success') and step_result.get('sanity_passed'))
 
             if not success and stop_on_fail:
                 logger.error(f"Stopping execution due to failure in step: {step_name}")
                 break
 
         # Run post-processing if all steps succeeded
-        if all(r.get('success', False) and r.get('sanity_passed', False) for r in results.values()):
+        if all_ok:
             self._run_post_process()
 
         # Save overall results
@@ -327,23 +521,23 @@ class ExperimentRunner:
             'experiment_config': str(self.config_path),
             'steps': results,
             'completed_at': time.time(),
-            'all_success': all(r.get('success', False) and r.get('sanity_passed', False) for r in results.values())
+            'all_success': all_ok
         }
 
         results_file = self.output_dir / "experiment_results.json"
-        with open(results_file, 'w') as f:
-            json.dump(overall_results, f, indent=2, default=str)
+        results_file.write_bytes(dump_json(overall_results))
 
         return overall_results
 
     def _run_post_process(self):
         """Run post-processing steps if defined."""
-        post_process = self.config.get('post_process', [])
-        for step in post_process:
+        for step in self._post_process:
             logger.info(f"Running post-process step: {step['name']}")
             try:
                 success, output, exit_code = self._execute_command(
                     step['cmd'],
+                    step['name'],
+                    1,
                     timeout_minutes=step.get('timeout_minutes', 30)
                 )
                 if not success:
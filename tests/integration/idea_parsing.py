@@ -0,0 +1,15 @@
+"""Helpers shared by the idea-file check scripts."""
+
+import math
+
+# Strings treated as true in the has_experiments column (same set as the orchestrators)
+TRUE_VALUES = frozenset(('true', '1', 'yes', 'y', 't'))
+
+
+def parse_has_experiments(value):
+    """Boolean parsing as the orchestrators' idea loaders expect it."""
+    if isinstance(value, str):
+        return value.strip().lower() in TRUE_VALUES
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return False
+    return bool(value)
@@ -1,6 +1,12 @@
+import sys
 import pandas as pd
 from pathlib import Path
 
+from idea_parsing import parse_has_experiments
+
+# Block-buffer stdout; the report is one print() per CSV row, flushed at exit
+sys.stdout.reconfigure(line_buffering=False, write_through=False)
+
 print("Testing CSV parsing...")
 print()
 
@@ -25,18 +31,11 @@ else:
 
 print()
 print("Parsing rows:")
-for idx, row in df.iterrows():
-    title = row['title']
-    has_exp_raw = row['has_experiments']
-    
-    # Test boolean parsing
-    if isinstance(has_exp_raw, str):
-        has_exp = has_exp_raw.lower() in ('true', '1', 'yes', 'y')
-    else:
-        has_exp = bool(has_exp_raw)
-    
-    exp_len = len(str(row['experiments'])) if pd.notna(row['experiments']) else 0
-    
+# Work column by column instead of building a Series per row
+has_exp_col = df['has_experiments'].map(parse_has_experiments).tolist()
+exp_len_col = df['experiments'].fillna('').astype(str).str.len().tolist()
+
+for idx, title, has_exp, exp_len in zip(df.index, df['title'], has_exp_col, exp_len_col):
     print(f"  Row {idx}: {title[:40]:40} | has_exp={has_exp:5} | exp_len={exp_len:4}")
     
     # Validate: if has_experiments is True, experiments should not be empty
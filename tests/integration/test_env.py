@@ -15,11 +15,14 @@ required = {
     'openhands': ['OPENHANDS_API_KEY']
 }
 
+# Plain dict snapshot; os.environ re-encodes keys and decodes values on every lookup
+env = dict(os.environ)
+
 print("Checking environment variables...")
 print()
 
 for var in required['ALL']:
-    val = os.environ.get(var)
+    val = env.get(var)
     if val:
         print(f"✅ {var}: {val[:10]}..." if len(val) > 10 else f"✅ {var}: {val}")
     else:
@@ -32,7 +35,7 @@ for provider, vars in required.items():
         continue
     print(f"\n{provider.upper()}:")
     for var in vars:
-        val = os.environ.get(var)
+        val = env.get(var)
         if val:
             print(f"  ✅ {var}: {val[:10]}...")
         else:
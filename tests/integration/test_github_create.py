@@ -18,8 +18,12 @@ headers = {
     'X-GitHub-Api-Version': '2022-11-28'
 }
 
+# One session for every call, so the TLS connection to GitHub is reused
+session = requests.Session()
+session.headers.update(headers)
+
 # Determine if org or user
-user_response = requests.get(f'https://api.github.com/users/{owner}', headers=headers)
+user_response = session.get(f'https://api.github.com/users/{owner}')
 if user_response.status_code != 200:
     print(f"❌ Cannot determine account type: {user_response.status_code}")
     print(f"   Error: {user_response.json()}")
@@ -42,7 +46,7 @@ payload = {
 }
 
 print(f"Creating test repository: {owner}/{test_repo_name}")
-response = requests.post(url, headers=headers, json=payload)
+response = session.post(url, json=payload)
 
 if response.status_code == 201:
     repo = response.json()
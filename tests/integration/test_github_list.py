@@ -17,8 +17,12 @@ headers = {
     'X-GitHub-Api-Version': '2022-11-28'
 }
 
+# One session for every call, so the TLS connection to GitHub is reused
+session = requests.Session()
+session.headers.update(headers)
+
 # Check if owner is org or user
-user_response = requests.get(f'https://api.github.com/users/{owner}', headers=headers)
+user_response = session.get(f'https://api.github.com/users/{owner}')
 if user_response.status_code != 200:
     print(f"❌ Cannot find user/org: {owner}")
     print(f"   Error: {user_response.json()}")
@@ -33,7 +37,7 @@ if account_type == 'Organization':
 else:
     repos_url = f'https://api.github.com/user/repos?per_page=5'
 
-repos_response = requests.get(repos_url, headers=headers)
+repos_response = session.get(repos_url)
 if repos_response.status_code == 200:
     repos = repos_response.json()
     print(f"✅ Can list repositories ({len(repos)} shown)")
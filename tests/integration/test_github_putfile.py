@@ -1,6 +1,6 @@
 import os
 import requests
-import base64
+import binascii
 
 # Load environment variables from .env if it exists
 try:
@@ -18,13 +18,22 @@ headers = {
     'X-GitHub-Api-Version': '2022-11-28'
 }
 
+# One session for every call, so the TLS connection to GitHub is reused
+session = requests.Session()
+session.headers.update(headers)
+
 # Find the test repo (or create it)
+# Newest repos first, so a repo from a recent test_github_create.py run is usually on the
+# first page; later pages are only fetched if it isn't
 test_repo_name = None
-repos_response = requests.get(f'https://api.github.com/user/repos?per_page=100', headers=headers)
-for repo in repos_response.json():
-    if 'orchestrator-test' in repo['name']:
-        test_repo_name = repo['full_name']
-        break
+next_url = 'https://api.github.com/user/repos?sort=created&direction=desc&per_page=30'
+while next_url and not test_repo_name:
+    repos_response = session.get(next_url)
+    for repo in repos_response.json():
+        if 'orchestrator-test' in repo['name']:
+            test_repo_name = repo['full_name']
+            break
+    next_url = repos_response.links.get('next', {}).get('url')
 
 if not test_repo_name:
     print("❌ No test repository found. Run test_github_create.py first")
@@ -34,7 +43,7 @@ print(f"Testing file creation in: {test_repo_name}")
 
 # Put a test file
 file_content = "# Test File\n\nThis is a test file created by the orchestrator test suite."
-content_b64 = base64.b64encode(file_content.encode()).decode()
+content_b64 = binascii.b2a_base64(file_content.encode('utf-8'), newline=False).decode('ascii')
 
 url = f'https://api.github.com/repos/{test_repo_name}/contents/TEST.md'
 payload = {
@@ -42,7 +51,7 @@ payload = {
     'content': content_b64
 }
 
-response = requests.put(url, headers=headers, json=payload)
+response = session.put(url, json=payload)
 
 if response.status_code in (201, 200):
     print("✅ File created successfully")
@@ -1,40 +1,45 @@
+import sys
 import pandas as pd
 import yaml
 
+from idea_parsing import parse_has_experiments
+
+# Block-buffer stdout; the report prints a few lines per experiment row, flushed at exit
+sys.stdout.reconfigure(line_buffering=False, write_through=False)
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 print("Testing YAML validation in pre-defined experiments...")
 print()
 
 df = pd.read_csv('ideas.csv')
 
-for idx, row in df.iterrows():
-    # Parse has_experiments
-    has_exp_raw = row['has_experiments']
-    if isinstance(has_exp_raw, str):
-        has_exp = has_exp_raw.lower() in ('true', '1', 'yes', 'y')
-    else:
-        has_exp = bool(has_exp_raw)
+# Only rows with pre-defined experiments have YAML to validate
+rows = df[df['has_experiments'].map(parse_has_experiments).astype(bool)]
+
+for idx, title, exp_yaml in zip(rows.index, rows['title'], rows['experiments']):
+    exp_text = '' if pd.isna(exp_yaml) else str(exp_yaml)
+    if exp_text.strip() == '':
+        print(f"❌ Row {idx} ({title}): has_experiments=True but experiments is empty")
+        continue
     
-    if has_exp:
-        title = row['title']
-        exp_yaml = row['experiments']
-        
-        if pd.isna(exp_yaml) or str(exp_yaml).strip() == '':
-            print(f"❌ Row {idx} ({title}): has_experiments=True but experiments is empty")
-            continue
+    try:
+        parsed = yaml.load(exp_text, Loader=YamlLoader)
+        print(f"✅ Row {idx} ({title[:30]}): YAML valid")
         
-        try:
-            parsed = yaml.safe_load(str(exp_yaml))
-            print(f"✅ Row {idx} ({title[:30]}): YAML valid")
+        # Basic validation
+        if 'steps' not in parsed:
+            print(f"   ⚠️  WARNING: No 'steps' key in YAML")
+        else:
+            print(f"   Found {len(parsed['steps'])} steps")
             
-            # Basic validation
-            if 'steps' not in parsed:
-                print(f"   ⚠️  WARNING: No 'steps' key in YAML")
-            else:
-                print(f"   Found {len(parsed['steps'])} steps")
-                
-        except yaml.YAMLError as e:
-            print(f"❌ Row {idx} ({title}): Invalid YAML")
-            print(f"   Error: {e}")
+    except yaml.YAMLError as e:
+        print(f"❌ Row {idx} ({title}): Invalid YAML")
+        print(f"   Error: {e}")
 
 print()
 print("YAML validation complete")
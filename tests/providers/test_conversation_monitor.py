@@ -0,0 +1,75 @@
+import importlib.util
+import os
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from unittest import mock
+
+ORCHESTRATOR_PATH = Path(__file__).resolve().parents[2] / 'providers' / 'openhands' / 'orchestrator.py'
+
+
+def load_orchestrator():
+    # The orchestrator opens its log file in the working directory at import time
+    previous_cwd = os.getcwd()
+    os.chdir(tempfile.mkdtemp())
+    try:
+        spec = importlib.util.spec_from_file_location('openhands_orchestrator', ORCHESTRATOR_PATH)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+    finally:
+        os.chdir(previous_cwd)
+
+
+orchestrator = load_orchestrator()
+
+
+def test_monitor_polls_all_conversations_from_one_thread():
+    # Statuses each conversation reports on successive polls; 'stuck' never finishes
+    scripted = {
+        'fast': ['running', 'completed'],
+        'slow': ['starting', 'running', 'running', 'running', 'idle'],
+        'stuck': ['running'] * 1000,
+    }
+    polls = {conversation_id: 0 for conversation_id in scripted}
+    polling_threads = set()
+
+    def get_conversation_status(conversation_id):
+        polling_threads.add(threading.current_thread().name)
+        statuses = scripted[conversation_id]
+        status = statuses[min(polls[conversation_id], len(statuses) - 1)]
+        polls[conversation_id] += 1
+        return {'status': status}
+
+    orch = orchestrator.OpenHandsOrchestrator(
+        orchestrator.RepoConfig(owner='test-owner', token='test-token'), 'test-openhands-key'
+    )
+    # Shrink the poll intervals so the backoff runs in milliseconds
+    with mock.patch.object(orchestrator, 'CONVERSATION_POLL_INTERVAL', 0.01), \
+            mock.patch.object(orchestrator, 'CONVERSATION_POLL_MAX_INTERVAL', 0.05), \
+            mock.patch.object(orch.openhands, 'get_conversation_status', get_conversation_status), \
+            mock.patch.object(orchestrator.ConversationMonitor, 'wait', autospec=True,
+                              side_effect=orchestrator.ConversationMonitor.wait) as wait:
+        final = orch.monitor_conversations(['fast', 'slow', 'stuck'], timeout_minutes=0.5 / 60)
+        monitor = wait.call_args[0][0]
+    orch.close()
+
+    assert final['fast']['status'] == 'completed'
+    assert final['slow']['status'] == 'idle'
+    assert final['stuck'] == {'status': 'timeout', 'conversation_id': 'stuck'}
+    assert polling_threads == {'conversation-monitor'}, f"polled from {polling_threads}"
+
+    # Nothing is left behind once every waiter has returned
+    monitor.join(timeout=1)
+    assert not monitor.is_alive()
+    assert monitor._watched == {} and monitor._results == {}
+
+
+if __name__ == '__main__':
+    try:
+        test_monitor_polls_all_conversations_from_one_thread()
+        print("✅ conversations monitored from one dispatcher thread")
+    except AssertionError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
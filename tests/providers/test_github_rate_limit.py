@@ -0,0 +1,120 @@
+import importlib.util
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest import mock
+
+import requests
+
+PROVIDERS_DIR = Path(__file__).resolve().parents[2] / 'providers'
+
+
+def load_orchestrator(provider):
+    # The orchestrators open their log file in the working directory at import time
+    previous_cwd = os.getcwd()
+    os.chdir(tempfile.mkdtemp())
+    try:
+        spec = importlib.util.spec_from_file_location(
+            f'{provider}_orchestrator', PROVIDERS_DIR / provider / 'orchestrator.py'
+        )
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+    finally:
+        os.chdir(previous_cwd)
+
+
+ORCHESTRATORS = [load_orchestrator('jules'), load_orchestrator('openhands')]
+
+
+def make_response(status_code, headers, body=''):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers)
+    response._content = body.encode('utf-8')
+    return response
+
+
+def test_primary_limit_waits_for_reset():
+    for module in ORCHESTRATORS:
+        response = make_response(403, {
+            'X-RateLimit-Remaining': '0',
+            'X-RateLimit-Reset': str(int(time.time()) + 120),
+        })
+        wait = module.GitHubClient._rate_limit_wait(response)
+        assert 110 <= wait <= 120, f"{module.__name__}: primary limit waited {wait}"
+
+
+def test_secondary_limit_uses_retry_after():
+    for module in ORCHESTRATORS:
+        response = make_response(403, {
+            'Retry-After': '60',
+            'X-RateLimit-Remaining': '4000',
+            'X-RateLimit-Reset': str(int(time.time()) + 3000),
+        })
+        wait = module.GitHubClient._rate_limit_wait(response)
+        assert wait == 60, f"{module.__name__}: secondary limit with Retry-After waited {wait}"
+
+
+def test_secondary_limit_without_retry_after():
+    for module in ORCHESTRATORS:
+        headers = {'X-RateLimit-Remaining': '4000', 'X-RateLimit-Reset': str(int(time.time()) + 3000)}
+        for response in (
+            make_response(429, headers),
+            make_response(403, headers, 'You have exceeded a secondary rate limit.'),
+        ):
+            wait = module.GitHubClient._rate_limit_wait(response)
+            assert wait == module.SECONDARY_RATE_LIMIT_WAIT, \
+                f"{module.__name__}: secondary limit without Retry-After waited {wait}"
+
+
+def test_plain_forbidden_is_not_retried():
+    for module in ORCHESTRATORS:
+        response = make_response(403, {
+            'X-RateLimit-Remaining': '4000',
+            'X-RateLimit-Reset': str(int(time.time()) + 3000),
+        }, 'Resource not accessible by integration')
+        assert module.GitHubClient._rate_limit_wait(response) is None
+
+
+def test_low_quota_pacing_is_shared_across_threads():
+    for module in ORCHESTRATORS:
+        client = module.GitHubClient('test-token', 'test-owner')
+        # 20 requests left over 100s: one request every 5s for the client as a whole
+        response = make_response(200, {
+            'X-RateLimit-Remaining': '20',
+            'X-RateLimit-Reset': str(int(time.time()) + 100),
+        })
+        pauses = []
+        with mock.patch.object(module.time, 'sleep', pauses.append):
+            threads = [threading.Thread(target=client._throttle, args=(response,)) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        # Each worker waits for its own slot rather than all pausing one interval at once
+        slots = [round(pause / 5) for pause in sorted(pauses)]
+        assert slots == [1, 2, 3, 4], f"{module.__name__}: pauses {sorted(pauses)}"
+
+
+if __name__ == '__main__':
+    tests = [
+        test_primary_limit_waits_for_reset,
+        test_secondary_limit_uses_retry_after,
+        test_secondary_limit_without_retry_after,
+        test_plain_forbidden_is_not_retried,
+        test_low_quota_pacing_is_shared_across_threads,
+    ]
+    failed = False
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            print(f"❌ {test.__name__}: {e}")
+            failed = True
+    sys.exit(1 if failed else 0)
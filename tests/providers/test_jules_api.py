@@ -21,7 +21,7 @@ headers = {
 # Test: List sources
 print("Testing Jules API...")
 url = 'https://jules.googleapis.com/v1alpha/sources'
-response = requests.get(url, headers=headers)
+response = requests.get(url, headers=headers, timeout=10)
 
 print(f"Status: {response.status_code}")
 
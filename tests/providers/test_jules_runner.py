@@ -0,0 +1,56 @@
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+RUNNER_PATH = Path(__file__).resolve().parents[2] / 'providers' / 'jules' / 'templates' / 'runner.py'
+
+MANIFEST = """
+steps:
+  - id: train
+    name: Train
+validation:
+  - step: train
+    checks:
+      - type: metric
+        path: metrics.json
+        key: accuracy
+        condition: "> 0.5"
+"""
+
+
+def load_runner():
+    spec = importlib.util.spec_from_file_location('jules_runner', RUNNER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_metric_check_with_nan_value():
+    previous_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        # The runner writes runner.log and reads metrics relative to the working directory
+        os.chdir(workdir)
+        try:
+            runner_module = load_runner()
+            Path('manifest.yaml').write_text(MANIFEST)
+            # json.dump writes NaN as a bare token by default
+            with open('metrics.json', 'w') as f:
+                json.dump({'accuracy': 0.9, 'loss': float('nan')}, f)
+
+            runner = runner_module.ExperimentRunner('manifest.yaml', 'results')
+            step_config = runner._steps_by_id['train']
+            assert runner._validate_step('train', step_config, {}), "metric check failed on a NaN metrics file"
+        finally:
+            os.chdir(previous_cwd)
+
+
+if __name__ == '__main__':
+    try:
+        test_metric_check_with_nan_value()
+        print("✅ metric check passed with a NaN metric present")
+    except AssertionError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
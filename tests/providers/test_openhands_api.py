@@ -23,7 +23,8 @@ print("Testing OpenHands API...")
 
 # Note: Exact endpoint may vary - check docs if this fails
 url = 'https://app.all-hands.dev/api/conversations'
-response = requests.get(url, headers=headers)
+# Only the response shape is reported, so ask for a single conversation
+response = requests.get(url, headers=headers, params={'limit': 1}, timeout=10)
 
 print(f"Status: {response.status_code}")
 
@@ -0,0 +1,51 @@
+import importlib.util
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+RUNNER_PATH = Path(__file__).resolve().parents[2] / 'providers' / 'openhands' / 'templates' / 'runner.py'
+
+SPEC = """
+steps: []
+post_process:
+  - name: write_marker
+    cmd: "python -c \\"open('post_process_ran.txt', 'w').write('ok')\\""
+    timeout_minutes: 1
+"""
+
+
+def load_runner():
+    spec = importlib.util.spec_from_file_location('openhands_runner', RUNNER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_post_process_step_runs():
+    previous_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        # The runner writes runner.log and runs commands in the working directory
+        os.chdir(workdir)
+        try:
+            runner_module = load_runner()
+            Path('experiments.yaml').write_text(SPEC)
+
+            runner = runner_module.ExperimentRunner('experiments.yaml', 'artifacts')
+            runner._run_post_process()
+
+            marker = Path('post_process_ran.txt')
+            assert marker.exists(), "post_process step did not run"
+            assert marker.read_text() == 'ok'
+            assert list(Path('artifacts/logs').glob('write_marker-a1-*.log'))
+        finally:
+            os.chdir(previous_cwd)
+
+
+if __name__ == '__main__':
+    try:
+        test_post_process_step_runs()
+        print("✅ post_process step ran")
+    except AssertionError as e:
+        print(f"❌ {e}")
+        sys.exit(1)